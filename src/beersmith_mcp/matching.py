@@ -1,22 +1,110 @@
 """Fuzzy ingredient matching for Grocy integration."""
 
+import heapq
 import re
-from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 from rapidfuzz import fuzz, process
+from rapidfuzz.distance import Indel
 
 from beersmith_mcp.models import IngredientMatch
 from beersmith_mcp.parser import BeerSmithParser
 
-
-@dataclass
+# Common brewing terms that don't help matching
+STOP_WORDS = frozenset(
+    {"malt", "malted", "hops", "hop", "yeast", "grain", "extract", "liquid", "dry"}
+)
+
+# Precompiled patterns for keyword extraction and name normalization
+_PAREN_RE = re.compile(r'\([^)]*\)')
+_WORD_RE = re.compile(r'\b[a-z]+\b')
+# Single-pass normalization: parenthetical content, years/vintages (e.g. "2023"), and a
+# trailing suffix such as "hops" or "malt" (which may itself be followed by a year)
+_NORMALIZE_RE = re.compile(
+    r'\([^)]*\)'
+    r'|\b20\d{2}\b'
+    r'|\s+(?:hops?|malt|grain|yeast|pellets?|leaf)(?=(?:\s*\b20\d{2}\b)*\s*$)'
+)
+
+# Fuzzy scorers as (scorer, weight, maximum score, length bounded); a candidate's
+# confidence is its best weighted score, normalized to 0.0-1.0. A length-bounded
+# scorer can never exceed 2 * min(len) / (len_a + len_b), so candidates whose
+# length is too different from the query's are skipped without scoring them.
+FUZZY_SCORERS = (
+    (Indel.normalized_similarity, 0.8, 1.0, True),  # Full names (same as fuzz.ratio)
+    (fuzz.token_set_ratio, 0.9, 100.0, False),  # Handles word reordering
+    (fuzz.partial_ratio, 0.7, 100.0, False),  # Handles substrings
+)
+KEYWORD_WEIGHT = 0.85
+
+# Number of match_ingredient results remembered per matcher
+MATCH_CACHE_SIZE = 1024
+
+
+# Names repeat across candidates, queries and matcher calls, so the regex work
+# for each distinct string is cached
+@lru_cache(maxsize=4096)
+def _extract_keywords_cached(text: str) -> tuple[str, ...]:
+    """Extract keywords from a string."""
+    # Remove common suffixes and split
+    text = text.lower()
+    # Remove parenthetical content
+    text = _PAREN_RE.sub('', text)
+    # Remove common brewing terms that don't help matching
+    words = _WORD_RE.findall(text)
+    return tuple(w for w in words if w not in STOP_WORDS and len(w) > 2)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_name_cached(name: str) -> str:
+    """Normalize a name for comparison."""
+    # Strip years, parenthetical content and common suffixes in one pass
+    name = _NORMALIZE_RE.sub('', name.lower())
+    # Normalize whitespace
+    return ' '.join(name.split())
+
+
+@dataclass(slots=True, frozen=True)
 class MatchCandidate:
     """Internal matching candidate."""
 
     name: str
     ingredient_type: str  # 'hop', 'grain', 'yeast', 'misc'
     beersmith_id: str
-    keywords: list[str]
+    keywords: tuple[str, ...]
+    normalized_name: str = ""  # Precomputed _normalize_name(name)
+    keyword_set: frozenset[str] = frozenset()  # For O(1) keyword lookups
+
+
+@dataclass(slots=True)
+class CandidateView:
+    """A selection of match candidates, as parallel columns for scoring."""
+
+    positions: Sequence[int]  # Position of each entry in the full candidates list
+    names: list[str]  # Normalized names
+    # The same entries ordered by name length, for length-bounded scorers
+    lengths: list[int] = field(init=False)
+    names_by_length: list[str] = field(init=False)
+    positions_by_length: list[int] = field(init=False)
+
+    def __post_init__(self):
+        order = sorted(range(len(self.names)), key=lambda i: len(self.names[i]))
+        self.lengths = [len(self.names[i]) for i in order]
+        self.names_by_length = [self.names[i] for i in order]
+        self.positions_by_length = [self.positions[i] for i in order]
+
+    def within_length(self, length: int, min_similarity: float) -> tuple[list[str], list[int]]:
+        """
+        Get the names (and their positions) that can reach min_similarity (0.0-1.0)
+        against a string of the given length under a length-bounded scorer.
+        """
+        lo = bisect_left(self.lengths, length * min_similarity / (2 - min_similarity))
+        hi = bisect_right(self.lengths, length * (2 - min_similarity) / min_similarity)
+        return self.names_by_length[lo:hi], self.positions_by_length[lo:hi]
 
 
 class IngredientMatcher:
@@ -26,6 +114,14 @@ class IngredientMatcher:
         """Initialize with a BeerSmith parser."""
         self.parser = parser
         self._candidates: list[MatchCandidate] | None = None
+        # Candidate columns used while scoring, parallel to the candidates list
+        self._normalized_names: list[str] | None = None
+        self._candidate_types: list[str] | None = None
+        self._keyword_index: dict[str, list[int]] | None = None
+        # Candidate selection per set of ingredient types (None for all candidates)
+        self._type_views: dict[frozenset[str] | None, CandidateView] = {}
+        # LRU of match_ingredient results, only valid for the current candidates
+        self._match_cache: OrderedDict[tuple, list[IngredientMatch]] = OrderedDict()
 
     def _build_candidates(self) -> list[MatchCandidate]:
         """Build the list of match candidates from BeerSmith data."""
@@ -42,7 +138,9 @@ class IngredientMatcher:
                     name=hop.name,
                     ingredient_type="hop",
                     beersmith_id=hop.id,
-                    keywords=keywords,
+                    keywords=tuple(keywords),
+                    normalized_name=self._normalize_name(hop.name),
+                    keyword_set=frozenset(keywords),
                 )
             )
 
@@ -58,7 +156,9 @@ class IngredientMatcher:
                     name=grain.name,
                     ingredient_type="grain",
                     beersmith_id=grain.id,
-                    keywords=keywords,
+                    keywords=tuple(keywords),
+                    normalized_name=self._normalize_name(grain.name),
+                    keyword_set=frozenset(keywords),
                 )
             )
 
@@ -73,7 +173,9 @@ class IngredientMatcher:
                     name=yeast.name,
                     ingredient_type="yeast",
                     beersmith_id=yeast.id,
-                    keywords=keywords,
+                    keywords=tuple(keywords),
+                    normalized_name=self._normalize_name(yeast.name),
+                    keyword_set=frozenset(keywords),
                 )
             )
 
@@ -85,7 +187,9 @@ class IngredientMatcher:
                     name=misc.name,
                     ingredient_type="misc",
                     beersmith_id=misc.id,
-                    keywords=keywords,
+                    keywords=tuple(keywords),
+                    normalized_name=self._normalize_name(misc.name),
+                    keyword_set=frozenset(keywords),
                 )
             )
 
@@ -96,32 +200,53 @@ class IngredientMatcher:
         """Get or build the candidates list."""
         if self._candidates is None:
             self._candidates = self._build_candidates()
+            self._match_cache.clear()
         return self._candidates
 
+    @property
+    def normalized_names(self) -> list[str]:
+        """Get or build the normalized candidate names, parallel to ``candidates``."""
+        if self._normalized_names is None:
+            self._normalized_names = [c.normalized_name for c in self.candidates]
+        return self._normalized_names
+
+    @property
+    def candidate_types(self) -> list[str]:
+        """Get or build the candidate ingredient types, parallel to ``candidates``."""
+        if self._candidate_types is None:
+            self._candidate_types = [c.ingredient_type for c in self.candidates]
+        return self._candidate_types
+
+    @property
+    def keyword_index(self) -> dict[str, list[int]]:
+        """Get or build the keyword -> candidate positions index."""
+        if self._keyword_index is None:
+            index: dict[str, list[int]] = {}
+            for pos, candidate in enumerate(self.candidates):
+                for kw in candidate.keyword_set:
+                    index.setdefault(kw, []).append(pos)
+            self._keyword_index = index
+        return self._keyword_index
+
+    def _type_view(self, ingredient_types: list[str] | None) -> CandidateView:
+        """Get the candidate selection for the given ingredient types."""
+        key = frozenset(ingredient_types) if ingredient_types else None
+        if key not in self._type_views:
+            if key is None:
+                positions = range(len(self.candidates))
+            else:
+                positions = [i for i, t in enumerate(self.candidate_types) if t in key]
+            names = [self.normalized_names[i] for i in positions]
+            self._type_views[key] = CandidateView(positions, names)
+        return self._type_views[key]
+
     def _extract_keywords(self, text: str) -> list[str]:
         """Extract keywords from a string."""
-        # Remove common suffixes and split
-        text = text.lower()
-        # Remove parenthetical content
-        text = re.sub(r'\([^)]*\)', '', text)
-        # Remove common brewing terms that don't help matching
-        stop_words = {'malt', 'malted', 'hops', 'hop', 'yeast', 'grain', 'extract', 'liquid', 'dry'}
-        words = re.findall(r'\b[a-z]+\b', text)
-        keywords = [w for w in words if w not in stop_words and len(w) > 2]
-        return keywords
+        return list(_extract_keywords_cached(text))
 
     def _normalize_name(self, name: str) -> str:
         """Normalize a name for comparison."""
-        name = name.lower()
-        # Remove year/vintage (e.g., "2023")
-        name = re.sub(r'\b20\d{2}\b', '', name)
-        # Remove common suffixes
-        name = re.sub(r'\s+(hops?|malt|grain|yeast|pellets?|leaf)\s*$', '', name)
-        # Remove parenthetical content
-        name = re.sub(r'\([^)]*\)', '', name)
-        # Normalize whitespace
-        name = ' '.join(name.split())
-        return name.strip()
+        return _normalize_name_cached(name)
 
     def match_ingredient(
         self,
@@ -142,59 +267,93 @@ class IngredientMatcher:
         Returns:
             List of IngredientMatch objects sorted by confidence
         """
-        matches = []
+        # The same names are matched over and over within a session
+        key = (query, frozenset(ingredient_types) if ingredient_types else None, threshold, limit)
+        matches = self._match_cache.get(key)
+        if matches is None:
+            matches = self._match_ingredient(query, ingredient_types, threshold, limit)
+            self._match_cache[key] = matches
+            if len(self._match_cache) > MATCH_CACHE_SIZE:
+                self._match_cache.popitem(last=False)
+        else:
+            self._match_cache.move_to_end(key)
+        return list(matches)
+
+    def _match_ingredient(
+        self,
+        query: str,
+        ingredient_types: list[str] | None,
+        threshold: float,
+        limit: int,
+    ) -> list[IngredientMatch]:
+        """Score all candidates against a query; see match_ingredient."""
         query_normalized = self._normalize_name(query)
         query_keywords = self._extract_keywords(query)
 
         # Filter candidates by type if specified
         candidates = self.candidates
-        if ingredient_types:
-            candidates = [c for c in candidates if c.ingredient_type in ingredient_types]
-
-        for candidate in candidates:
-            # Calculate various similarity scores
-            scores = []
-
-            # 1. Exact match (after normalization)
-            candidate_normalized = self._normalize_name(candidate.name)
-            if query_normalized == candidate_normalized:
-                scores.append(1.0)
-
-            # 2. Fuzzy ratio on full names
-            ratio = fuzz.ratio(query_normalized, candidate_normalized) / 100.0
-            scores.append(ratio * 0.8)
-
-            # 3. Token set ratio (handles word reordering)
-            token_ratio = fuzz.token_set_ratio(query_normalized, candidate_normalized) / 100.0
-            scores.append(token_ratio * 0.9)
-
-            # 4. Partial ratio (handles substrings)
-            partial_ratio = fuzz.partial_ratio(query_normalized, candidate_normalized) / 100.0
-            scores.append(partial_ratio * 0.7)
-
-            # 5. Keyword matching
-            if query_keywords and candidate.keywords:
-                keyword_matches = sum(1 for kw in query_keywords if kw in candidate.keywords)
-                keyword_score = keyword_matches / max(len(query_keywords), 1)
-                scores.append(keyword_score * 0.85)
-
-            # Take the best score
-            best_score = max(scores) if scores else 0.0
-
-            if best_score >= threshold:
-                matches.append(
-                    IngredientMatch(
-                        query=query,
-                        matched_name=candidate.name,
-                        matched_type=candidate.ingredient_type,
-                        confidence=round(best_score, 3),
-                        beersmith_id=candidate.beersmith_id,
-                    )
+        view = self._type_view(ingredient_types)
+
+        # Best score per candidate position; only candidates reaching the threshold are kept
+        # 1. Exact match (after normalization)
+        best_scores = {
+            view.positions[i]: 1.0 for i, name in enumerate(view.names) if name == query_normalized
+        }
+
+        # Nothing but an exact match scores 1.0, so enough of them settle the result
+        if len(best_scores) < limit:
+            # 2-4. Fuzzy scores, computed for all candidates at once by rapidfuzz
+            for scorer, weight, max_score, length_bounded in FUZZY_SCORERS:
+                if weight < threshold:
+                    continue  # The weighted score can never reach the threshold
+                # Slightly lenient: rapidfuzz rounds cutoffs internally, which can
+                # drop a borderline candidate; the exact threshold is applied below
+                min_similarity = max(threshold / weight - 0.0001, 0.0)
+                if length_bounded and min_similarity > 0:
+                    names, positions = view.within_length(len(query_normalized), min_similarity)
+                else:
+                    names, positions = view.names, view.positions
+                results = process.extract(
+                    query_normalized,
+                    names,
+                    scorer=scorer,
+                    limit=None,
+                    score_cutoff=min_similarity * max_score,
                 )
-
-        # Sort by confidence and limit
-        matches.sort(key=lambda m: m.confidence, reverse=True)
-        return matches[:limit]
+                for _, score, i in results:
+                    pos = positions[i]
+                    weighted = score / max_score * weight
+                    best_scores[pos] = max(best_scores.get(pos, 0.0), weighted)
+
+            # 5. Keyword matching, only visiting candidates that share a keyword
+            if query_keywords and KEYWORD_WEIGHT >= threshold:
+                types = self.candidate_types
+                keyword_hits: Counter[int] = Counter()
+                for kw in query_keywords:
+                    keyword_hits.update(self.keyword_index.get(kw, ()))
+                for pos, keyword_matches in keyword_hits.items():
+                    if ingredient_types and types[pos] not in ingredient_types:
+                        continue
+                    keyword_score = keyword_matches / max(len(query_keywords), 1)
+                    keyword_score *= KEYWORD_WEIGHT
+                    best_scores[pos] = max(best_scores.get(pos, 0.0), keyword_score)
+
+        # Rank positions first and only build result models for the winners; rank on
+        # the rounded confidence that is reported, with ties kept in candidate order
+        confidences = {
+            pos: round(score, 3) for pos, score in best_scores.items() if score >= threshold
+        }
+        top = heapq.nlargest(limit, sorted(confidences), key=confidences.__getitem__)
+        return [
+            IngredientMatch(
+                query=query,
+                matched_name=candidates[pos].name,
+                matched_type=candidates[pos].ingredient_type,
+                confidence=confidences[pos],
+                beersmith_id=candidates[pos].beersmith_id,
+            )
+            for pos in top
+        ]
 
     def match_ingredients_batch(
         self,
@@ -213,8 +372,10 @@ class IngredientMatcher:
         Returns:
             Dictionary mapping each query to its matches
         """
+        # Each query is scored against all candidates in one rapidfuzz pass per
+        # scorer; repeated queries map to the same result, so score them once
         results = {}
-        for query in queries:
+        for query in dict.fromkeys(queries):
             results[query] = self.match_ingredient(
                 query, ingredient_types=ingredient_types, threshold=threshold
             )
@@ -227,27 +388,18 @@ class IngredientMatcher:
         This uses a simple heuristic based on similar names and types.
         For hops, we could enhance this with actual substitution data.
         """
-        substitutes = []
-
-        # Get the original ingredient
-        matches = self.match_ingredient(
-            ingredient_name, ingredient_types=[ingredient_type], threshold=0.9, limit=1
-        )
-        if not matches:
-            return substitutes
-
-        original = matches[0].matched_name
-
-        # Find similar ingredients
+        # One query serves both purposes: the best match is the original ingredient
+        # (if it is confident enough) and the rest are the similar candidates
         similar = self.match_ingredient(
             ingredient_name, ingredient_types=[ingredient_type], threshold=0.4, limit=10
         )
+        if not similar or similar[0].confidence < 0.9:
+            return []
 
-        # Return similar items excluding the original
-        for match in similar:
-            if match.matched_name != original:
-                substitutes.append(match.matched_name)
+        original = similar[0].matched_name
 
+        # Return similar items excluding the original
+        substitutes = [m.matched_name for m in similar if m.matched_name != original]
         return substitutes[:5]
 
 
@@ -274,6 +426,10 @@ HOP_SUBSTITUTES = {
 def get_hop_substitutes(hop_name: str) -> list[str]:
     """Get known substitutes for a hop variety."""
     hop_lower = hop_name.lower()
+    # Most lookups use the plain variety name, which is a direct hit
+    subs = HOP_SUBSTITUTES.get(hop_lower)
+    if subs is not None:
+        return subs
     for key, subs in HOP_SUBSTITUTES.items():
         if key in hop_lower or hop_lower in key:
             return subs
@@ -1,10 +1,21 @@
 """Parser for BeerSmith .bsmx XML files."""
 
+import asyncio
 import html
+import io
+import json
 import os
 import re
 import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cache, lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, TypeVar
 
@@ -80,6 +91,138 @@ HTML_ENTITIES = {
     '&Ccedil;': 'Ç',
 }
 
+# Value shapes for _convert_value: a character that can't appear in anything int() or
+# float() accept, a plain integer and a plain decimal
+_NOT_NUMBER_RE = re.compile(r'[^\d\s+\-._eEnNaAiIfFtTyY]')
+_INT_RE = re.compile(r'[+-]?\d+')
+_FLOAT_RE = re.compile(r'[+-]?(?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?')
+
+# Precompiled element lookups for recipes (a [1] step matches find()'s first-match behavior)
+_XP_CLOUD_RECIPE = etree.XPath("F_C_RECIPE[1]")
+_XP_STYLE = etree.XPath("F_R_STYLE[1]")
+_XP_EQUIPMENT = etree.XPath("F_R_EQUIPMENT[1]")
+_XP_MASH = etree.XPath("F_R_MASH[1]")
+_XP_MASH_STEPS = etree.XPath("steps[1]/Data[1]/MashStep")
+_XP_GRAINS = etree.XPath("Ingredients[1]/Data[1]/Grain")
+_XP_HOPS = etree.XPath("Ingredients[1]/Data[1]/Hops")
+_XP_YEASTS = etree.XPath("Ingredients[1]/Data[1]/Yeast")
+_XP_MISCS = etree.XPath("Ingredients[1]/Data[1]/Misc")
+_XP_WATERS = etree.XPath("Ingredients[1]/Data[1]/Water")
+
+# An XML declaration, which can't be kept when wrapping a file's content in another root
+_XML_DECLARATION_RE = re.compile(rb'^\s*<\?xml[^>]*\?>')
+
+# The end of Recipe.bsmx's main Data section: its </Data> followed by the folder trailer
+# (<_TExpanded>, <TExtra>, then <TxLog>1</TxLog>). Only matched at candidate positions.
+_MAIN_DATA_END_TOKEN = b"<TxLog>1</TxLog>"
+_MAIN_DATA_END_RE = re.compile(
+    rb'</Data>\s*\n\s*<_TExpanded>[^<]*</[^>]+>[^<]*<TExtra>[^<]*</[^>]+>[^<]*<TxLog>1</TxLog>'
+)
+
+# One ingredient record in a database file, per tag update_ingredient can edit
+_INGREDIENT_CHUNK_RES = {
+    tag: re.compile(f'<{tag}>.*?</{tag}>'.encode(), re.DOTALL)
+    for tag in ("Grain", "Hops", "Yeast", "Misc")
+}
+
+# Buffer size for rewriting database files, see _replace_file
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Linux ioctl that makes one file a copy-on-write clone of another (Btrfs, XFS), see _clone_file
+_FICLONE = 0x40049409
+
+# One reusable XMLParser per thread (parsers can't be shared between threads), see _xml_parser
+_parser_local = threading.local()
+
+# Characters replaced with '_' when a recipe name is used as a file name
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\-_]')
+
+# Numeric entities and the named ones in HTML_ENTITIES, replaced in a single pass over
+# the raw bytes. XML's own entities (&amp; etc.) and unknown names don't match at all and
+# are left to lxml.
+_HTML_ENTITY_BYTES = {
+    entity.encode('ascii'): replacement.encode('utf-8')
+    for entity, replacement in HTML_ENTITIES.items()
+}
+_ENTITY_RE = re.compile(
+    rb'&(?:#x([0-9a-fA-F]+)|#(\d+)|(?:'
+    + b'|'.join(re.escape(entity[1:-1]) for entity in _HTML_ENTITY_BYTES)
+    + rb'));'
+)
+
+
+def _replace_entity(match: re.Match) -> bytes:
+    hex_code, dec_code = match.groups()
+    if hex_code:
+        return chr(int(hex_code, 16)).encode('utf-8')
+    if dec_code:
+        return chr(int(dec_code)).encode('utf-8')
+    return _HTML_ENTITY_BYTES[match.group(0)]
+
+
+def _xml_parser() -> etree.XMLParser:
+    """Get this thread's parser for whole .bsmx files."""
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = etree.XMLParser(recover=True, encoding='utf-8', huge_tree=True, collect_ids=False)
+        _parser_local.parser = parser
+    return parser
+
+
+# Characters html.escape replaces (quote=True)
+_XML_SPECIAL_RE = re.compile(r'[&<>"\']')
+
+
+def _escape_xml_text(text: str) -> str:
+    """Escape text for XML, converting non-ASCII to numeric character references."""
+    # Most names are plain ASCII with nothing to escape; both checks run in C
+    if text.isascii():
+        return html.escape(text) if _XML_SPECIAL_RE.search(text) else text
+
+    # First do standard HTML escaping, then encode non-ASCII characters as XML numeric
+    # entities (&#233; etc.) in the same C-level pass as the ASCII encode
+    return html.escape(text).encode('ascii', 'xmlcharrefreplace').decode('ascii')
+
+
+# Longest text BeerSmithParser._xml_escape caches the escaped form of
+_XML_ESCAPE_CACHE_MAX_LEN = 256
+_cached_xml_escape = lru_cache(maxsize=4096)(_escape_xml_text)
+
+
+def _clone_file(source: Path, dest: Path) -> bool:
+    """Create dest as a copy-on-write clone of source; False if the filesystem can't."""
+    try:
+        if sys.platform == "darwin":
+            import ctypes
+
+            # clonefile(2) on APFS copies metadata too
+            libc = ctypes.CDLL(None, use_errno=True)
+            return libc.clonefile(os.fsencode(source), os.fsencode(dest), 0) == 0
+        if sys.platform.startswith("linux"):
+            import fcntl
+
+            with open(source, "rb") as src, open(dest, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            shutil.copystat(source, dest)
+            return True
+    except (OSError, AttributeError):
+        dest.unlink(missing_ok=True)
+    return False
+
+
+@cache
+def _model_keys(model_class: type[BaseModel]) -> frozenset[str]:
+    """Get the keys a model reads from an item dict: its field names and aliases."""
+    keys = set(model_class.model_fields)
+    keys.update(field.alias for field in model_class.model_fields.values() if field.alias)
+    return frozenset(keys)
+
+
+@lru_cache(maxsize=256)
+def _xml_field_re(xml_tag: str) -> re.Pattern[str]:
+    """Get the compiled pattern for a <xml_tag>...</xml_tag> field, see _update_xml_fields."""
+    return re.compile(f'<{xml_tag}>.*?</{xml_tag}>')
+
 
 class BeerSmithParser:
     """Parser for BeerSmith .bsmx files."""
@@ -88,75 +231,138 @@ class BeerSmithParser:
         """Initialize parser with BeerSmith data path."""
         self.beersmith_path = Path(beersmith_path or DEFAULT_BEERSMITH_PATH)
         self.backup_path = self.beersmith_path / "mcp_backups"
-        self._cache: dict[str, tuple[float, Any]] = {}  # filename -> (mtime, parsed_data)
+        # Cached data is keyed on a (mtime_ns, size) stamp of its file, see _file_stamp
+        # filename -> (stamp, sorted items) for files that are streamed, not kept as a tree
+        self._items_cache: dict[str, tuple[tuple[int, int], tuple]] = {}
+        # filename -> (cached items, lowercase name -> item) for exact name lookups
+        self._name_indexes: dict[str, tuple[tuple, dict[str, Any]]] = {}
+        # (filename, attributes) -> (cached items, lowercased attribute values per item)
+        self._lowered_cache: dict[tuple[str, tuple[str, ...]], tuple[tuple, list]] = {}
+        # (Recipe.bsmx, Cloud.bsmx stamps), local and cloud recipes, id and name indexes
+        self._recipes_cache: tuple[tuple, tuple[Recipe, ...], dict, dict, tuple] | None = None
+        self._load_locks: dict[str, threading.Lock] = {}  # filename -> lock, see _file_lock
+        self._write_lock = threading.Lock()  # Serializes the *_async writes, see _run_write
 
     def _xml_escape(self, text: str) -> str:
         """Escape text for XML, converting non-ASCII to numeric character references."""
-        # First do standard HTML escaping
-        text = html.escape(text)
-        # Then encode non-ASCII characters as XML numeric entities
-        result = []
-        for char in text:
-            if ord(char) > 127:
-                result.append(f'&#{ord(char)};')
-            else:
-                result.append(char)
-        return ''.join(result)
+        # Names and other short fields repeat across ingredients and exports; long free
+        # text such as notes rarely does, so it isn't kept in the cache
+        if len(text) <= _XML_ESCAPE_CACHE_MAX_LEN:
+            return _cached_xml_escape(text)
+        return _escape_xml_text(text)
 
     def _get_file_path(self, filename: str) -> Path:
         """Get full path to a BeerSmith file."""
         return self.beersmith_path / filename
 
+    def _file_stamp(self, filepath: Path) -> tuple[int, int] | None:
+        """
+        Get a file's (mtime_ns, size), or None if it doesn't exist.
+
+        The size catches rewrites within the mtime resolution of coarse filesystems.
+        """
+        try:
+            stat = filepath.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def _parse_xml_file(self, filename: str) -> etree._Element | None:
-        """Parse a .bsmx XML file and return the root element."""
+        """
+        Parse a whole .bsmx XML file and return the root element.
+
+        Debug-only: the accessors stream their files (see iter_elements and
+        _stream_recipes), so nothing else builds full trees. This shows the tree the
+        parser sees after its entity and encoding fixes, and is not cached.
+        """
         filepath = self._get_file_path(filename)
         if not filepath.exists():
             return None
 
-        # Check cache
-        mtime = filepath.stat().st_mtime
-        if filename in self._cache:
-            cached_mtime, cached_data = self._cache[filename]
-            if cached_mtime == mtime:
-                return cached_data
-
-        # BeerSmith files are not well-formed XML - they may have HTML entities
-        with open(filepath, "r", encoding="utf-8", errors="replace") as f:
-            content = f.read()
-
-        # Replace all known HTML entities with Unicode equivalents
-        for entity, replacement in HTML_ENTITIES.items():
-            content = content.replace(entity, replacement)
-        
-        # Handle numeric entities (&#39; etc.)
-        content = re.sub(r'&#(\d+);', lambda m: chr(int(m.group(1))), content)
-        content = re.sub(r'&#x([0-9a-fA-F]+);', lambda m: chr(int(m.group(1), 16)), content)
+        content = self._read_xml_content(filepath)
 
         # Use lxml with recovery mode for better parsing
         try:
-            parser = etree.XMLParser(recover=True, encoding='utf-8')
-            root = etree.fromstring(content.encode('utf-8'), parser=parser)
-            self._cache[filename] = (mtime, root)
-            return root
+            return etree.fromstring(content, parser=_xml_parser())
         except etree.XMLSyntaxError as e:
             # Silently handle parse errors
             return None
 
-    def _element_to_dict(self, element: etree._Element) -> dict[str, Any]:
-        """Convert an XML element to a dictionary with lowercase keys."""
+    def _read_xml_content(self, filepath: Path) -> bytes:
+        """Read a .bsmx file as UTF-8 bytes that lxml can parse."""
+        # Work on the bytes directly; only invalid UTF-8 needs a decode/encode round trip
+        content = filepath.read_bytes()
+        if not content.isascii():
+            try:
+                content.decode('utf-8')
+            except UnicodeDecodeError:
+                content = content.decode('utf-8', errors='replace').encode('utf-8')
+
+        # BeerSmith files are not well-formed XML - they may have HTML entities
+        # Replace HTML entities and numeric entities (&#39; etc.) with Unicode equivalents
+        if b'&' in content:
+            content = _ENTITY_RE.sub(_replace_entity, content)
+
+        return content
+
+    def iter_elements(
+        self, filename: str, tag: str, multiple_roots: bool = False
+    ) -> Iterator[etree._Element]:
+        """
+        Stream all elements with the given tag from a .bsmx file.
+
+        Unlike _parse_xml_file, the full tree is never kept: each element is
+        cleared once the caller moves on to the next one, so callers must not
+        hold on to yielded elements.
+
+        With multiple_roots, the content is wrapped in a synthetic root element so
+        that elements after the first root (invalid XML, but BeerSmith writes it)
+        are parsed too; those roots then have the wrapper as their parent.
+        """
+        filepath = self._get_file_path(filename)
+        if not filepath.exists():
+            return
+
+        content = self._read_xml_content(filepath)
+        if multiple_roots:
+            content = _XML_DECLARATION_RE.sub(b"", content)
+            content = b"<BeerSmithRoots>" + content + b"</BeerSmithRoots>"
+        for _, elem in etree.iterparse(
+            io.BytesIO(content), events=("end",), tag=tag, recover=True, huge_tree=True
+        ):
+            yield elem
+            elem.clear()
+            # Drop processed siblings so the partial tree stays small
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+    def _element_to_dict(
+        self, element: etree._Element, keys: frozenset[str] | None = None
+    ) -> dict[str, Any]:
+        """
+        Convert an XML element to a dictionary with lowercase keys.
+
+        If keys is given, only children with those (lowercase) tags are converted.
+        """
         result = {}
+        convert_value = self._convert_value
         for child in element:
             tag = child.tag.lower()
-            if len(child) > 0:
+            if keys is not None and tag not in keys:
+                continue
+            if len(child):
                 # Has children - recurse
                 result[tag] = self._element_to_dict(child)
             else:
-                # Leaf node - get text
-                text = child.text or ""
-                # Decode HTML entities
-                text = html.unescape(text)
-                # Try to convert to appropriate type
-                result[tag] = self._convert_value(text)
+                # Leaf node - entities were expanded before parsing, so only text that
+                # still contains '&' (e.g. double-escaped) needs html.unescape
+                text = child.text
+                if not text:
+                    result[tag] = ""
+                elif '&' in text:
+                    result[tag] = convert_value(html.unescape(text))
+                else:
+                    result[tag] = convert_value(text)
         return result
 
     def _convert_value(self, text: str) -> Any:
@@ -164,6 +370,15 @@ class BeerSmithParser:
         if not text:
             return ""
 
+        # Classify the common shapes up front instead of raising on every non-number
+        if _NOT_NUMBER_RE.search(text):
+            return text
+        if _INT_RE.fullmatch(text):
+            return int(text)
+        if _FLOAT_RE.fullmatch(text):
+            return float(text)
+
+        # Rarer numeric spellings ("1e5", " 12 ", "nan", ...)
         # Try int
         try:
             if "." not in text:
@@ -180,286 +395,374 @@ class BeerSmithParser:
         # Return as string
         return text
 
-    def _parse_items(
-        self, root: etree._Element, item_tag: str, model_class: type[T]
+    def _file_lock(self, filename: str) -> threading.Lock:
+        """Get the lock that serializes loading a file, so concurrent callers parse it once."""
+        return self._load_locks.setdefault(filename, threading.Lock())
+
+    def _load_items(
+        self,
+        filename: str,
+        item_tag: str,
+        model_class: type[T],
+        sort_key: Callable[[T], Any],
+        parse_item: Callable[[etree._Element], T] | None = None,
+        multiple_roots: bool = False,
+    ) -> tuple[T, ...]:
+        """
+        Parse all items of a given type from a .bsmx file, sorted by sort_key.
+
+        Items are the item_tag children of Data elements. The file is streamed so
+        only the resulting models are kept (and cached until the file changes).
+        parse_item overrides how an item element becomes a model. With
+        multiple_roots, extra root item_tag elements are items too, unless an
+        item with the same name was already found.
+        """
+        stamp = self._file_stamp(self._get_file_path(filename))
+        if stamp is None:
+            return ()
+
+        cached = self._items_cache.get(filename)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        with self._file_lock(filename):
+            # Another thread may have loaded it while we waited
+            cached = self._items_cache.get(filename)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+
+            items = self._parse_file_items(
+                filename, item_tag, model_class, parse_item, multiple_roots
+            )
+
+            # Sorted once here; filtering keeps the order, so callers don't sort again
+            sorted_items = tuple(sorted(items, key=sort_key))
+            self._items_cache[filename] = (stamp, sorted_items)
+            return sorted_items
+
+    def _parse_file_items(
+        self,
+        filename: str,
+        item_tag: str,
+        model_class: type[T],
+        parse_item: Callable[[etree._Element], T] | None,
+        multiple_roots: bool,
     ) -> list[T]:
-        """Parse all items of a given type from an XML root."""
+        """Stream the items for _load_items, in file order."""
+        if parse_item is None:
+            # BeerSmith stores many more fields than the models use; skip converting the rest
+            keys = _model_keys(model_class)
+
+            def parse_item(item_elem: etree._Element) -> T:
+                return model_class.model_validate(self._element_to_dict(item_elem, keys))
+
         items = []
-        
-        # Find all Data sections that contain items
-        for data in root.iter("Data"):
-            for item_elem in data.findall(item_tag):
+        names = set()
+        try:
+            for item_elem in self.iter_elements(filename, item_tag, multiple_roots):
+                parent = item_elem.getparent()
+                if parent is None:
+                    continue
+                # A root that holds Data is a container, not an item
+                is_extra_root = (
+                    multiple_roots and parent.getparent() is None and item_elem.find("Data") is None
+                )
+                if parent.tag != "Data" and not is_extra_root:
+                    continue
                 try:
-                    item_dict = self._element_to_dict(item_elem)
-                    item = model_class.model_validate(item_dict)
-                    items.append(item)
+                    item = parse_item(item_elem)
                 except Exception as e:
                     # Silently handle parse errors
                     continue
+                if is_extra_root and item.name in names:
+                    continue  # Avoid duplicates
+                names.add(item.name)
+                items.append(item)
+        except etree.XMLSyntaxError as e:
+            # Silently handle parse errors
+            return []
 
         return items
 
-    # === Hop Methods ===
+    def _name_index(self, filename: str, *name_keys: Callable[[Any], str]) -> dict[str, Any]:
+        """
+        Map lowercase names to the first item (in sorted order) with that name.
 
-    def get_hops(self, search: str | None = None, hop_type: int | None = None) -> list[Hop]:
-        """Get all hops, optionally filtered."""
-        root = self._parse_xml_file("Hops.bsmx")
-        if root is None:
+        Built once per cached item list, which must already be loaded by _load_items.
+        """
+        if filename not in self._items_cache:
+            return {}
+
+        _, items = self._items_cache[filename]
+        if filename in self._name_indexes:
+            indexed_items, index = self._name_indexes[filename]
+            if indexed_items is items:
+                return index
+
+        index = {}
+        for item in items:
+            for name_key in name_keys:
+                index.setdefault(name_key(item).lower(), item)
+        self._name_indexes[filename] = (items, index)
+        return index
+
+    def _lowered(self, filename: str, *attrs: str) -> list[tuple[str, ...]]:
+        """
+        Get the lowercased values of the given attributes for each item, for substring filters.
+
+        Built once per cached item list, which must already be loaded by _load_items.
+        """
+        if filename not in self._items_cache:
             return []
 
-        hops = self._parse_items(root, "Hops", Hop)
+        _, items = self._items_cache[filename]
+        key = (filename, attrs)
+        if key in self._lowered_cache:
+            lowered_items, rows = self._lowered_cache[key]
+            if lowered_items is items:
+                return rows
 
-        # Filter by search term
-        if search:
-            search_lower = search.lower()
-            hops = [h for h in hops if search_lower in h.name.lower() or search_lower in h.origin.lower()]
+        rows = [tuple(getattr(item, attr).lower() for attr in attrs) for item in items]
+        self._lowered_cache[key] = (items, rows)
+        return rows
 
-        # Filter by type
-        if hop_type is not None:
-            hops = [h for h in hops if h.type == hop_type]
+    def warm_cache(self, max_workers: int = 4) -> None:
+        """
+        Load every BeerSmith file into the caches ahead of the first request.
 
-        return sorted(hops, key=lambda h: h.name)
+        The files are independent, so they are loaded concurrently (lxml releases
+        the GIL while parsing). Errors are ignored here; a later request for the
+        same data reports them as usual.
+        """
+        loaders = [
+            self.get_hops,
+            self.get_grains,
+            self.get_yeasts,
+            self.get_water_profiles,
+            self.get_styles,
+            self.get_equipment_profiles,
+            self.get_mash_profiles,
+            self.get_carbonation_profiles,
+            self.get_age_profiles,
+            self.get_misc_ingredients,
+            self._load_recipes,
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for loader in loaders:
+                executor.submit(loader)
+
+    # === Hop Methods ===
+
+    def get_hops(self, search: str | None = None, hop_type: int | None = None) -> list[Hop]:
+        """Get all hops, optionally filtered."""
+        hops = self._load_items("Hops.bsmx", "Hops", Hop, sort_key=attrgetter("name"))
+
+        if not search and hop_type is None:
+            return list(hops)
+
+        # Filter by search term and type in one pass
+        search_lower = search.lower() if search else ""
+        lowered = self._lowered("Hops.bsmx", "name", "origin")
+        return [
+            h
+            for h, (name, origin) in zip(hops, lowered)
+            if (search_lower in name or search_lower in origin)
+            and (hop_type is None or h.type == hop_type)
+        ]
 
     def get_hop(self, name: str) -> Hop | None:
         """Get a specific hop by name."""
-        hops = self.get_hops(search=name)
-        for hop in hops:
-            if hop.name.lower() == name.lower():
-                return hop
-        return hops[0] if hops else None
+        self.get_hops()  # Loads the cached list the index is built from
+        name_lower = name.lower()
+        hop = self._name_index("Hops.bsmx", attrgetter("name")).get(name_lower)
+        if hop is None:
+            hops = self.get_hops(search=name)
+            hop = hops[0] if hops else None
+        return hop
 
     # === Grain Methods ===
 
     def get_grains(self, search: str | None = None, grain_type: int | None = None) -> list[Grain]:
         """Get all grains/fermentables, optionally filtered."""
-        root = self._parse_xml_file("Grain.bsmx")
-        if root is None:
-            return []
-
-        grains = self._parse_items(root, "Grain", Grain)
-
-        # Filter by search term
-        if search:
-            search_lower = search.lower()
-            grains = [g for g in grains if search_lower in g.name.lower() or search_lower in g.origin.lower()]
-
-        # Filter by type
-        if grain_type is not None:
-            grains = [g for g in grains if g.type == grain_type]
-
-        return sorted(grains, key=lambda g: g.name)
+        grains = self._load_items("Grain.bsmx", "Grain", Grain, sort_key=attrgetter("name"))
+
+        if not search and grain_type is None:
+            return list(grains)
+
+        # Filter by search term and type in one pass
+        search_lower = search.lower() if search else ""
+        lowered = self._lowered("Grain.bsmx", "name", "origin")
+        return [
+            g
+            for g, (name, origin) in zip(grains, lowered)
+            if (search_lower in name or search_lower in origin)
+            and (grain_type is None or g.type == grain_type)
+        ]
 
     def get_grain(self, name: str) -> Grain | None:
         """Get a specific grain by name."""
-        grains = self.get_grains(search=name)
-        for grain in grains:
-            if grain.name.lower() == name.lower():
-                return grain
-        return grains[0] if grains else None
+        self.get_grains()  # Loads the cached list the index is built from
+        name_lower = name.lower()
+        grain = self._name_index("Grain.bsmx", attrgetter("name")).get(name_lower)
+        if grain is None:
+            grains = self.get_grains(search=name)
+            grain = grains[0] if grains else None
+        return grain
 
     # === Yeast Methods ===
 
     def get_yeasts(self, search: str | None = None, lab: str | None = None) -> list[Yeast]:
         """Get all yeasts, optionally filtered."""
-        root = self._parse_xml_file("Yeast.bsmx")
-        if root is None:
-            return []
-
-        yeasts = self._parse_items(root, "Yeast", Yeast)
-
-        # Filter by search term
-        if search:
-            search_lower = search.lower()
-            yeasts = [y for y in yeasts if search_lower in y.name.lower() or 
-                      search_lower in y.lab.lower() or 
-                      search_lower in y.product_id.lower()]
-
-        # Filter by lab
-        if lab:
-            lab_lower = lab.lower()
-            yeasts = [y for y in yeasts if lab_lower in y.lab.lower()]
-
-        return sorted(yeasts, key=lambda y: (y.lab, y.name))
+        yeasts = self._load_items("Yeast.bsmx", "Yeast", Yeast, sort_key=attrgetter("lab", "name"))
+
+        # Filter by search term and lab
+        if search or lab:
+            search_lower = search.lower() if search else ""
+            lab_lower = lab.lower() if lab else ""
+            lowered = self._lowered("Yeast.bsmx", "name", "lab", "product_id")
+            yeasts = [
+                y
+                for y, (name, y_lab, product_id) in zip(yeasts, lowered)
+                if (search_lower in name or search_lower in y_lab or search_lower in product_id)
+                and lab_lower in y_lab
+            ]
+
+        return list(yeasts)
 
     def get_yeast(self, name: str) -> Yeast | None:
         """Get a specific yeast by name or product ID."""
-        yeasts = self.get_yeasts(search=name)
-        for yeast in yeasts:
-            if yeast.name.lower() == name.lower() or yeast.product_id.lower() == name.lower():
-                return yeast
-        return yeasts[0] if yeasts else None
+        self.get_yeasts()  # Loads the cached list the index is built from
+        name_lower = name.lower()
+        index = self._name_index("Yeast.bsmx", attrgetter("name"), attrgetter("product_id"))
+        yeast = index.get(name_lower)
+        if yeast is None:
+            yeasts = self.get_yeasts(search=name)
+            yeast = yeasts[0] if yeasts else None
+        return yeast
 
     # === Water Methods ===
 
     def get_water_profiles(self, search: str | None = None) -> list[Water]:
         """Get all water profiles, optionally filtered."""
-        root = self._parse_xml_file("Water.bsmx")
-        if root is None:
-            return []
-
-        waters = self._parse_items(root, "Water", Water)
+        waters = self._load_items("Water.bsmx", "Water", Water, sort_key=attrgetter("name"))
 
         # Filter by search term
         if search:
             search_lower = search.lower()
-            waters = [w for w in waters if search_lower in w.name.lower()]
+            lowered = self._lowered("Water.bsmx", "name")
+            waters = [w for w, (name,) in zip(waters, lowered) if search_lower in name]
 
-        return sorted(waters, key=lambda w: w.name)
+        return list(waters)
 
     def get_water_profile(self, name: str) -> Water | None:
         """Get a specific water profile by name."""
-        waters = self.get_water_profiles(search=name)
-        for water in waters:
-            if water.name.lower() == name.lower():
-                return water
-        return waters[0] if waters else None
+        self.get_water_profiles()  # Loads the cached list the index is built from
+        name_lower = name.lower()
+        water = self._name_index("Water.bsmx", attrgetter("name")).get(name_lower)
+        if water is None:
+            waters = self.get_water_profiles(search=name)
+            water = waters[0] if waters else None
+        return water
 
     # === Style Methods ===
 
     def get_styles(self, search: str | None = None, category: str | None = None) -> list[Style]:
         """Get all beer styles, optionally filtered."""
-        root = self._parse_xml_file("Style.bsmx")
-        if root is None:
-            return []
-
-        styles = self._parse_items(root, "Style", Style)
-
-        # Filter by search term
-        if search:
-            search_lower = search.lower()
-            styles = [s for s in styles if search_lower in s.name.lower() or 
-                      search_lower in s.category.lower()]
-
-        # Filter by category
-        if category:
-            cat_lower = category.lower()
-            styles = [s for s in styles if cat_lower in s.category.lower()]
-
-        return sorted(styles, key=lambda s: (s.category, s.name))
+        styles = self._load_items(
+            "Style.bsmx", "Style", Style, sort_key=attrgetter("category", "name")
+        )
+
+        # Filter by search term and category
+        if search or category:
+            search_lower = search.lower() if search else ""
+            cat_lower = category.lower() if category else ""
+            lowered = self._lowered("Style.bsmx", "name", "category")
+            styles = [
+                s
+                for s, (name, s_category) in zip(styles, lowered)
+                if (search_lower in name or search_lower in s_category) and cat_lower in s_category
+            ]
+
+        return list(styles)
 
     def get_style(self, name: str) -> Style | None:
         """Get a specific style by name."""
-        styles = self.get_styles(search=name)
-        for style in styles:
-            if style.name.lower() == name.lower():
-                return style
-        return styles[0] if styles else None
+        self.get_styles()  # Loads the cached list the index is built from
+        name_lower = name.lower()
+        style = self._name_index("Style.bsmx", attrgetter("name")).get(name_lower)
+        if style is None:
+            styles = self.get_styles(search=name)
+            style = styles[0] if styles else None
+        return style
 
     # === Equipment Methods ===
 
     def get_equipment_profiles(self) -> list[Equipment]:
         """Get all equipment profiles."""
-        # Clear cache to ensure we get fresh data (equipment may be updated frequently)
-        if "Equipment.bsmx" in self._cache:
-            del self._cache["Equipment.bsmx"]
-            
-        root = self._parse_xml_file("Equipment.bsmx")
-        if root is None:
-            return []
-
-        equipment = self._parse_items(root, "Equipment", Equipment)
-        
         # BeerSmith's Equipment.bsmx sometimes has multiple root Equipment elements (invalid XML)
-        # We need to parse these separately. Read the file and look for all Equipment elements
-        try:
-            file_path = self._get_file_path("Equipment.bsmx")
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-            
-            # Find all top-level <Equipment>...</Equipment> blocks after the first one
-            import re
-            # Split by </Equipment> to find multiple roots
-            parts = content.split('</Equipment>')
-            
-            # Process parts after the first complete Equipment element
-            for i, part in enumerate(parts[1:], 1):  # Skip first (main root)
-                # Check if this part starts a new Equipment element
-                if '<Equipment>' in part:
-                    # Extract just this Equipment section
-                    eq_start = part.find('<Equipment>')
-                    eq_content = part[eq_start:]
-                    # Add closing tag if not present
-                    if '</Equipment>' not in eq_content:
-                        eq_content += parts[i+1].split('<')[0] + '</Equipment>' if i+1 < len(parts) else '</Equipment>'
-                    else:
-                        eq_content = eq_content.split('</Equipment>')[0] + '</Equipment>'
-                    
-                    # Try to parse this Equipment element
-                    try:
-                        parser_xml = etree.XMLParser(recover=True, encoding='utf-8')
-                        eq_root = etree.fromstring(eq_content.encode('utf-8'), parser=parser_xml)
-                        
-                        item_dict = self._element_to_dict(eq_root)
-                        if "f_e_name" in item_dict:
-                            item = Equipment.model_validate(item_dict)
-                            # Avoid duplicates
-                            if not any(e.name == item.name for e in equipment):
-                                equipment.append(item)
-                    except Exception as e:
-                        continue  # Skip malformed extra equipment
-        except Exception as e:
-            pass  # Silently handle parse errors
-        
-        return sorted(equipment, key=lambda e: e.name)
-        
-        return sorted(equipment, key=lambda e: e.name)
+        equipment = self._load_items(
+            "Equipment.bsmx",
+            "Equipment",
+            Equipment,
+            sort_key=attrgetter("name"),
+            multiple_roots=True,
+        )
+        return list(equipment)
 
     def get_equipment(self, name: str) -> Equipment | None:
         """Get a specific equipment profile by name."""
         equipment_list = self.get_equipment_profiles()
-        for equipment in equipment_list:
-            if equipment.name.lower() == name.lower():
-                return equipment
-        # Try partial match
-        for equipment in equipment_list:
-            if name.lower() in equipment.name.lower():
-                return equipment
-        return None
+        name_lower = name.lower()
+        equipment = self._name_index("Equipment.bsmx", attrgetter("name")).get(name_lower)
+        if equipment is None:
+            # Try partial match
+            lowered = self._lowered("Equipment.bsmx", "name")
+            equipment = next(
+                (e for e, (e_name,) in zip(equipment_list, lowered) if name_lower in e_name),
+                None,
+            )
+        return equipment
 
     # === Mash Methods ===
 
+    def _parse_mash_element(self, mash_elem: etree._Element) -> MashProfile:
+        """Parse a single mash profile element, including its steps."""
+        mash_dict = self._element_to_dict(mash_elem, _model_keys(MashProfile))
+        mash = MashProfile.model_validate(mash_dict)
+
+        # Parse steps
+        for step_elem in _XP_MASH_STEPS(mash_elem):
+            step_dict = self._element_to_dict(step_elem, _model_keys(MashStep))
+            step = MashStep.model_validate(step_dict)
+            mash.steps.append(step)
+
+        return mash
+
     def get_mash_profiles(self) -> list[MashProfile]:
         """Get all mash profiles."""
-        root = self._parse_xml_file("Mash.bsmx")
-        if root is None:
-            return []
-
-        profiles = []
         # Mash profiles have a more complex structure with nested steps
-        for data in root.iter("Data"):
-            for mash_elem in data.findall("Mash"):
-                try:
-                    mash_dict = self._element_to_dict(mash_elem)
-                    mash = MashProfile.model_validate(mash_dict)
-                    
-                    # Parse steps
-                    steps_elem = mash_elem.find("steps")
-                    if steps_elem is not None:
-                        steps_data = steps_elem.find("Data")
-                        if steps_data is not None:
-                            for step_elem in steps_data.findall("MashStep"):
-                                step_dict = self._element_to_dict(step_elem)
-                                step = MashStep.model_validate(step_dict)
-                                mash.steps.append(step)
-                    
-                    profiles.append(mash)
-                except Exception as e:
-                    # Silently handle parse errors
-                    pass
-
-        return sorted(profiles, key=lambda m: m.name)
+        profiles = self._load_items(
+            "Mash.bsmx",
+            "Mash",
+            MashProfile,
+            sort_key=attrgetter("name"),
+            parse_item=self._parse_mash_element,
+        )
+        return list(profiles)
 
     def get_mash_profile(self, name: str) -> MashProfile | None:
         """Get a specific mash profile by name."""
         profiles = self.get_mash_profiles()
-        for profile in profiles:
-            if profile.name.lower() == name.lower():
-                return profile
-        # Try partial match
-        for profile in profiles:
-            if name.lower() in profile.name.lower():
-                return profile
-        return None
+        name_lower = name.lower()
+        profile = self._name_index("Mash.bsmx", attrgetter("name")).get(name_lower)
+        if profile is None:
+            # Try partial match
+            lowered = self._lowered("Mash.bsmx", "name")
+            profile = next(
+                (p for p, (p_name,) in zip(profiles, lowered) if name_lower in p_name),
+                None,
+            )
+        return profile
 
     # === Carbonation Methods ===
 
@@ -467,34 +770,24 @@ class BeerSmithParser:
         """Get all carbonation profiles."""
         from beersmith_mcp.models import Carbonation
         
-        root = self._parse_xml_file("Carbonation.bsmx")
-        if root is None:
-            return []
-
-        profiles = []
-        for data in root.iter("Data"):
-            for carb_elem in data.findall("Carbonation"):
-                try:
-                    carb_dict = self._element_to_dict(carb_elem)
-                    carb = Carbonation.model_validate(carb_dict)
-                    profiles.append(carb)
-                except Exception as e:
-                    # Silently handle parse errors
-                    pass
-
-        return sorted(profiles, key=lambda c: c.name)
+        profiles = self._load_items(
+            "Carbonation.bsmx", "Carbonation", Carbonation, sort_key=attrgetter("name")
+        )
+        return list(profiles)
 
     def get_carbonation_profile(self, name: str):
         """Get a specific carbonation profile by name."""
         profiles = self.get_carbonation_profiles()
-        for profile in profiles:
-            if profile.name.lower() == name.lower():
-                return profile
-        # Try partial match
-        for profile in profiles:
-            if name.lower() in profile.name.lower():
-                return profile
-        return None
+        name_lower = name.lower()
+        profile = self._name_index("Carbonation.bsmx", attrgetter("name")).get(name_lower)
+        if profile is None:
+            # Try partial match
+            lowered = self._lowered("Carbonation.bsmx", "name")
+            profile = next(
+                (p for p, (p_name,) in zip(profiles, lowered) if name_lower in p_name),
+                None,
+            )
+        return profile
 
     # === Fermentation/Aging Methods ===
 
@@ -502,194 +795,240 @@ class BeerSmithParser:
         """Get all fermentation/aging profiles."""
         from beersmith_mcp.models import AgeProfile
         
-        root = self._parse_xml_file("Age.bsmx")
-        if root is None:
-            return []
-
-        profiles = []
-        for data in root.iter("Data"):
-            for age_elem in data.findall("Age"):
-                try:
-                    age_dict = self._element_to_dict(age_elem)
-                    age = AgeProfile.model_validate(age_dict)
-                    profiles.append(age)
-                except Exception as e:
-                    # Silently handle parse errors
-                    pass
-
-        return sorted(profiles, key=lambda a: a.name)
+        profiles = self._load_items("Age.bsmx", "Age", AgeProfile, sort_key=attrgetter("name"))
+        return list(profiles)
 
     def get_age_profile(self, name: str):
         """Get a specific age profile by name."""
         profiles = self.get_age_profiles()
-        for profile in profiles:
-            if profile.name.lower() == name.lower():
-                return profile
-        # Try partial match
-        for profile in profiles:
-            if name.lower() in profile.name.lower():
-                return profile
-        return None
+        name_lower = name.lower()
+        profile = self._name_index("Age.bsmx", attrgetter("name")).get(name_lower)
+        if profile is None:
+            # Try partial match
+            lowered = self._lowered("Age.bsmx", "name")
+            profile = next(
+                (p for p, (p_name,) in zip(profiles, lowered) if name_lower in p_name),
+                None,
+            )
+        return profile
 
     # === Misc Methods ===
 
     def get_misc_ingredients(self, search: str | None = None) -> list[Misc]:
         """Get all miscellaneous ingredients."""
-        root = self._parse_xml_file("Misc.bsmx")
-        if root is None:
-            return []
-
-        miscs = self._parse_items(root, "Misc", Misc)
+        miscs = self._load_items("Misc.bsmx", "Misc", Misc, sort_key=attrgetter("name"))
 
         if search:
             search_lower = search.lower()
-            miscs = [m for m in miscs if search_lower in m.name.lower()]
+            lowered = self._lowered("Misc.bsmx", "name")
+            miscs = [m for m, (name,) in zip(miscs, lowered) if search_lower in name]
 
-        return sorted(miscs, key=lambda m: m.name)
+        return list(miscs)
 
     # === Recipe Methods ===
 
     def _parse_recipe_element(self, recipe_elem: etree._Element) -> Recipe | None:
         """Parse a single recipe element into a Recipe object."""
         try:
-            recipe_dict = self._element_to_dict(recipe_elem)
+            recipe_dict = self._element_to_dict(recipe_elem, _model_keys(Recipe))
             recipe = Recipe.model_validate(recipe_dict)
 
             # Parse embedded style
-            style_elem = recipe_elem.find("F_R_STYLE")
-            if style_elem is not None:
-                style_dict = self._element_to_dict(style_elem)
+            for style_elem in _XP_STYLE(recipe_elem):
+                style_dict = self._element_to_dict(style_elem, _model_keys(Style))
                 recipe.style = Style.model_validate(style_dict)
 
             # Parse embedded equipment
-            equip_elem = recipe_elem.find("F_R_EQUIPMENT")
-            if equip_elem is not None:
-                equip_dict = self._element_to_dict(equip_elem)
+            for equip_elem in _XP_EQUIPMENT(recipe_elem):
+                equip_dict = self._element_to_dict(equip_elem, _model_keys(Equipment))
                 recipe.equipment = Equipment.model_validate(equip_dict)
 
-            # Parse embedded mash
-            mash_elem = recipe_elem.find("F_R_MASH")
-            if mash_elem is not None:
-                mash_dict = self._element_to_dict(mash_elem)
-                recipe.mash = MashProfile.model_validate(mash_dict)
-                
-                # Parse mash steps
-                steps_elem = mash_elem.find("steps")
-                if steps_elem is not None:
-                    steps_data = steps_elem.find("Data")
-                    if steps_data is not None:
-                        for step_elem in steps_data.findall("MashStep"):
-                            step_dict = self._element_to_dict(step_elem)
-                            step = MashStep.model_validate(step_dict)
-                            recipe.mash.steps.append(step)
+            # Parse embedded mash, including its steps
+            for mash_elem in _XP_MASH(recipe_elem):
+                recipe.mash = self._parse_mash_element(mash_elem)
 
             # Parse ingredients
-            ingredients_elem = recipe_elem.find("Ingredients")
-            if ingredients_elem is not None:
-                ingredients_data = ingredients_elem.find("Data")
-                if ingredients_data is not None:
-                    # Grains
-                    for grain_elem in ingredients_data.findall("Grain"):
-                        grain_dict = self._element_to_dict(grain_elem)
-                        grain = RecipeGrain.model_validate(grain_dict)
-                        recipe.grains.append(grain)
-
-                    # Hops
-                    for hop_elem in ingredients_data.findall("Hops"):
-                        hop_dict = self._element_to_dict(hop_elem)
-                        hop = RecipeHop.model_validate(hop_dict)
-                        recipe.hops.append(hop)
-
-                    # Yeasts
-                    for yeast_elem in ingredients_data.findall("Yeast"):
-                        yeast_dict = self._element_to_dict(yeast_elem)
-                        yeast = RecipeYeast.model_validate(yeast_dict)
-                        recipe.yeasts.append(yeast)
-
-                    # Misc
-                    for misc_elem in ingredients_data.findall("Misc"):
-                        misc_dict = self._element_to_dict(misc_elem)
-                        misc = RecipeMisc.model_validate(misc_dict)
-                        recipe.miscs.append(misc)
-
-                    # Water
-                    for water_elem in ingredients_data.findall("Water"):
-                        water_dict = self._element_to_dict(water_elem)
-                        water = RecipeWater.model_validate(water_dict)
-                        recipe.waters.append(water)
+            # Grains
+            for grain_elem in _XP_GRAINS(recipe_elem):
+                grain_dict = self._element_to_dict(grain_elem, _model_keys(RecipeGrain))
+                grain = RecipeGrain.model_validate(grain_dict)
+                recipe.grains.append(grain)
+
+            # Hops
+            for hop_elem in _XP_HOPS(recipe_elem):
+                hop_dict = self._element_to_dict(hop_elem, _model_keys(RecipeHop))
+                hop = RecipeHop.model_validate(hop_dict)
+                recipe.hops.append(hop)
+
+            # Yeasts
+            for yeast_elem in _XP_YEASTS(recipe_elem):
+                yeast_dict = self._element_to_dict(yeast_elem, _model_keys(RecipeYeast))
+                yeast = RecipeYeast.model_validate(yeast_dict)
+                recipe.yeasts.append(yeast)
+
+            # Misc
+            for misc_elem in _XP_MISCS(recipe_elem):
+                misc_dict = self._element_to_dict(misc_elem, _model_keys(RecipeMisc))
+                misc = RecipeMisc.model_validate(misc_dict)
+                recipe.miscs.append(misc)
+
+            # Water
+            for water_elem in _XP_WATERS(recipe_elem):
+                water_dict = self._element_to_dict(water_elem, _model_keys(RecipeWater))
+                water = RecipeWater.model_validate(water_dict)
+                recipe.waters.append(water)
 
             return recipe
         except Exception as e:
             # Silently handle parse errors
             return None
 
-    def _find_recipes_recursive(self, element: etree._Element, folder_path: str = "/") -> list[Recipe]:
-        """Recursively find all recipes in folders."""
+    def _stream_recipes(self, filename: str, folder_path: str = "/") -> list[Recipe]:
+        """
+        Parse all recipes in a recipe file, with their folder paths.
+
+        Folders are Table elements whose first Data child holds Recipe and Cloud
+        elements, more Tables and more Data. The file is streamed: each recipe is
+        parsed when it closes and then cleared, so the whole tree is never kept.
+        Within a folder, recipes come out as subfolders first, then recipes, then
+        cloud recipes, then those in nested Data elements.
+        """
+        filepath = self._get_file_path(filename)
+        if not filepath.exists():
+            return []
+
+        content = self._read_xml_content(filepath)
+
+        # Open folder containers (the root and Data elements) map to their
+        # ([subfolder tables], [recipes], [cloud recipes], [nested containers]);
+        # open Tables map to their [name, first Data container]
+        containers: dict[etree._Element, tuple[list, list, list, list]] = {}
+        tables: dict[etree._Element, list] = {}
+        root_container = None
+        try:
+            for event, elem in etree.iterparse(
+                io.BytesIO(content),
+                events=("start", "end"),
+                tag=("Table", "Data", "Recipe", "Cloud"),
+                recover=True,
+                huge_tree=True,
+            ):
+                parent = elem.getparent()
+                if root_container is None:
+                    root = elem
+                    while root.getparent() is not None:
+                        root = root.getparent()
+                    root_container = containers[root] = ([], [], [], [])
+                parent_container = containers.get(parent)
+
+                if event == "start":
+                    if elem.tag == "Table" and parent_container is not None:
+                        table = tables[elem] = ["", None]
+                        parent_container[0].append(table)
+                    elif elem.tag == "Data":
+                        if parent_container is not None:
+                            containers[elem] = ([], [], [], [])
+                            parent_container[3].append(containers[elem])
+                        elif parent in tables and tables[parent][1] is None:
+                            containers[elem] = tables[parent][1] = ([], [], [], [])
+                    continue
+
+                if elem.tag == "Table":
+                    table = tables.pop(elem, None)
+                    if table is not None:
+                        table[0] = elem.findtext("Name", "")
+                elif elem.tag == "Data":
+                    containers.pop(elem, None)
+                elif parent_container is not None:
+                    if elem.tag == "Recipe":
+                        recipe = self._parse_recipe_element(elem)
+                        if recipe:
+                            parent_container[1].append(recipe)
+                    else:
+                        # Cloud recipes have F_C_RECIPE sub-element with the actual recipe data
+                        for recipe_data in _XP_CLOUD_RECIPE(elem):
+                            recipe = self._parse_recipe_element(recipe_data)
+                            if recipe:
+                                parent_container[2].append(recipe)
+                    elem.clear()
+                    # Drop processed siblings so the partial tree stays small
+                    while elem.getprevious() is not None:
+                        del parent[0]
+        except etree.XMLSyntaxError:
+            # Silently handle parse errors, keeping the recipes read so far
+            pass
+
+        if root_container is None:
+            return []
+        return self._collect_recipes(root_container, folder_path)
+
+    def _collect_recipes(self, container: tuple, folder_path: str) -> list[Recipe]:
+        """Flatten a folder container from _stream_recipes, filling in folder paths."""
+        subfolders, local_recipes, cloud_recipes, nested = container
         recipes = []
 
-        # Check for Table elements (folders)
-        for table in element.findall("Table"):
-            table_name = table.findtext("Name", "")
-            folder_data = table.find("Data")
+        for table_name, folder_data in subfolders:
             if folder_data is not None:
-                # Recurse into folder
-                new_folder = f"{folder_path}{table_name}/"
-                recipes.extend(self._find_recipes_recursive(folder_data, new_folder))
-
-        # Check for Recipe elements directly (local recipes)
-        for recipe_elem in element.findall("Recipe"):
-            recipe = self._parse_recipe_element(recipe_elem)
-            if recipe:
-                if not recipe.folder or recipe.folder == "/":
-                    recipe.folder = folder_path
-                recipes.append(recipe)
-
-        # Check for Cloud elements (cloud recipes)
-        for cloud_elem in element.findall("Cloud"):
-            # Cloud recipes have F_C_RECIPE sub-element with the actual recipe data
-            recipe_data = cloud_elem.find("F_C_RECIPE")
-            if recipe_data is not None:
-                recipe = self._parse_recipe_element(recipe_data)
-                if recipe:
-                    if not recipe.folder or recipe.folder == "/":
-                        recipe.folder = folder_path
-                    recipes.append(recipe)
-
-        # Check in Data elements
-        for data in element.findall("Data"):
-            recipes.extend(self._find_recipes_recursive(data, folder_path))
+                recipes.extend(self._collect_recipes(folder_data, f"{folder_path}{table_name}/"))
+
+        for recipe in local_recipes + cloud_recipes:
+            if not recipe.folder or recipe.folder == "/":
+                recipe.folder = folder_path
+            recipes.append(recipe)
+
+        for data in nested:
+            recipes.extend(self._collect_recipes(data, folder_path))
 
         return recipes
 
-    def get_recipes(self, folder: str | None = None, search: str | None = None) -> list[RecipeSummary]:
-        """Get all recipes as summaries from both local and cloud storage."""
-        recipes = []
-        
-        # Load local recipes
-        root = self._parse_xml_file("Recipe.bsmx")
-        if root is not None:
-            recipes.extend(self._find_recipes_recursive(root))
-        
-        # Load cloud recipes
-        cloud_root = self._parse_xml_file("Cloud.bsmx")
-        if cloud_root is not None:
-            cloud_recipes = self._find_recipes_recursive(cloud_root, folder_path="/Cloud/")
-            recipes.extend(cloud_recipes)
-
-        # Filter by folder
-        if folder:
-            folder_lower = folder.lower()
-            recipes = [r for r in recipes if folder_lower in r.folder.lower()]
-
-        # Filter by search
-        if search:
-            search_lower = search.lower()
-            recipes = [r for r in recipes if search_lower in r.name.lower()]
+    def _load_recipes(
+        self,
+    ) -> tuple[
+        tuple[Recipe, ...],
+        dict[str, Recipe],
+        dict[str, Recipe],
+        tuple[tuple[str, str, RecipeSummary], ...],
+    ]:
+        """
+        Get all local and cloud recipes, plus indexes of the first recipe per id and lowercase name.
+
+        Also returns every recipe's summary, sorted by folder and name, as
+        (lowercase folder, lowercase name, summary) rows for get_recipes to filter.
+
+        Parsed once and shared by get_recipes and get_recipe until either file changes.
+        """
+        stamps = tuple(
+            self._file_stamp(self._get_file_path(filename))
+            for filename in ("Recipe.bsmx", "Cloud.bsmx")
+        )
+        cached = self._recipes_cache
+        if cached is not None and cached[0] == stamps:
+            return cached[1:]
+
+        with self._file_lock("Recipe.bsmx"):
+            # Another thread may have loaded them while we waited
+            cached = self._recipes_cache
+            if cached is not None and cached[0] == stamps:
+                return cached[1:]
+            return self._parse_recipes(stamps)
+
+    def _parse_recipes(self, stamps: tuple) -> tuple:
+        """Parse and index the recipes for _load_recipes."""
+        # The files are independent and lxml releases the GIL while parsing,
+        # so Cloud.bsmx is streamed in a worker while Recipe.bsmx is streamed here
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            cloud_future = executor.submit(self._stream_recipes, "Cloud.bsmx", "/Cloud/")
+            recipes = self._stream_recipes("Recipe.bsmx")
+            recipes.extend(cloud_future.result())
+
+        by_id: dict[str, Recipe] = {}
+        by_name: dict[str, Recipe] = {}
+        for recipe in recipes:
+            by_id.setdefault(recipe.id, recipe)
+            by_name.setdefault(recipe.name.lower(), recipe)
 
-        # Convert to summaries
-        summaries = []
-        for r in recipes:
-            summaries.append(
+        summaries = sorted(
+            (
                 RecipeSummary(
                     id=r.id,
                     name=r.name,
@@ -701,35 +1040,41 @@ class BeerSmithParser:
                     color_srm=r.color_srm,
                     folder=r.folder,
                 )
-            )
+                for r in recipes
+            ),
+            key=attrgetter("folder", "name"),
+        )
+        summary_rows = tuple((r.folder.lower(), r.name.lower(), r) for r in summaries)
+
+        self._recipes_cache = (stamps, tuple(recipes), by_id, by_name, summary_rows)
+        return self._recipes_cache[1:]
 
-        return sorted(summaries, key=lambda r: (r.folder, r.name))
+    def get_recipes(self, folder: str | None = None, search: str | None = None) -> list[RecipeSummary]:
+        """Get all recipes as summaries from both local and cloud storage."""
+        # Summaries are built and sorted once per load, so filtering keeps their order
+        _, _, _, rows = self._load_recipes()
+        folder_lower = folder.lower() if folder else ""
+        search_lower = search.lower() if search else ""
+
+        return [
+            summary
+            for recipe_folder, recipe_name, summary in rows
+            if folder_lower in recipe_folder and search_lower in recipe_name
+        ]
 
     def get_recipe(self, name_or_id: str) -> Recipe | None:
         """Get a specific recipe by name or ID from both local and cloud storage."""
-        recipes = []
-        
-        # Load local recipes
-        root = self._parse_xml_file("Recipe.bsmx")
-        if root is not None:
-            recipes.extend(self._find_recipes_recursive(root))
-        
-        # Load cloud recipes
-        cloud_root = self._parse_xml_file("Cloud.bsmx")
-        if cloud_root is not None:
-            recipes.extend(self._find_recipes_recursive(cloud_root, folder_path="/Cloud/"))
-        
+        recipes, by_id, by_name, _ = self._load_recipes()
+
         # Try exact match by ID first
-        for recipe in recipes:
-            if recipe.id == name_or_id:
-                return recipe
-        
+        if name_or_id in by_id:
+            return by_id[name_or_id]
+
         # Try exact match by name
         name_lower = name_or_id.lower()
-        for recipe in recipes:
-            if recipe.name.lower() == name_lower:
-                return recipe
-        
+        if name_lower in by_name:
+            return by_name[name_lower]
+
         # Try partial match
         for recipe in recipes:
             if name_lower in recipe.name.lower():
@@ -752,11 +1097,10 @@ class BeerSmithParser:
 
         # Copy file
         dest = backup_dir / filename
-        shutil.copy2(source, dest)
+        self._copy_file(source, dest)
 
         # Create manifest
         manifest = backup_dir / "manifest.json"
-        import json
         manifest.write_text(json.dumps({
             "timestamp": timestamp,
             "files": [filename],
@@ -765,195 +1109,256 @@ class BeerSmithParser:
 
         return dest
 
-    def _generate_recipe_xml(self, recipe: Recipe) -> str:
-        """Generate XML string for a recipe."""
+    def _copy_file(self, source: Path, dest: Path) -> None:
+        """Copy source to dest with its metadata, as a clone where the filesystem allows."""
+        dest.unlink(missing_ok=True)
+        if not _clone_file(source, dest):
+            shutil.copy2(source, dest)
+
+    def _link_or_copy(self, source: Path, dest: Path) -> bool:
+        """Hard-link source to dest, or copy it if that isn't possible; True if linked."""
+        dest.unlink(missing_ok=True)
+        try:
+            os.link(source, dest)
+            return True
+        except OSError:
+            self._copy_file(source, dest)
+            return False
+
+    def _replace_file(self, path: Path, chunks: Iterable[bytes]) -> None:
+        """Write chunks to a temporary file next to path, then move it over path."""
+        # Replace the real file, not a symlink to it (e.g. a database linked into Dropbox)
+        path = Path(os.path.realpath(path))
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            # Small chunks are coalesced; ones larger than the buffer go straight to the file
+            with os.fdopen(fd, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                # The data must be on disk before the rename makes it the database
+                f.flush()
+                os.fsync(f.fileno())
+            shutil.copymode(path, tmp_name)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _generate_recipe_xml(self, recipe: Recipe, today: str | None = None) -> str:
+        """Generate XML string for a recipe, dated today unless a date string is given."""
         # This is a simplified implementation - a full implementation would
         # need to match BeerSmith's exact XML structure
-        lines = [
-            f"<Recipe><_PERMID_>{recipe.id}</_PERMID_>",
-            f"<_MOD_>{datetime.now().strftime('%Y-%m-%d')}</_MOD_>",
-            f"<F_R_NAME>{self._xml_escape(recipe.name)}</F_R_NAME>",
-            f"<F_R_BREWER>{self._xml_escape(recipe.brewer)}</F_R_BREWER>",
-            f"<F_R_ASST_BREWER></F_R_ASST_BREWER>",
-            f"<F_R_DATE>{recipe.recipe_date or datetime.now().strftime('%Y-%m-%d')}</F_R_DATE>",
-            f"<F_R_INV_DATE>{datetime.now().strftime('%Y-%m-%d')}</F_R_INV_DATE>",
-            f"<F_R_FOLDER_NAME>{self._xml_escape(recipe.folder)}</F_R_FOLDER_NAME>",
-            f"<F_R_GRAIN_USE_SET>1</F_R_GRAIN_USE_SET>",
-            f"<F_R_VOLUME_MEASURED>0.0000000</F_R_VOLUME_MEASURED>",
-            f"<F_R_VOLUME_MEASURED_SET>0</F_R_VOLUME_MEASURED_SET>",
-            f"<F_R_FINAL_VOL_MEASURED>0.0000000</F_R_FINAL_VOL_MEASURED>",
-            f"<F_R_FINAL_VOL_MEASURED_SET>0</F_R_FINAL_VOL_MEASURED_SET>",
-            f"<F_R_MASH_TIMER>0</F_R_MASH_TIMER>",
-            f"<F_R_BOIL_TIMER>0</F_R_BOIL_TIMER>",
-            f"<F_R_MTIMER_DOWN>0</F_R_MTIMER_DOWN>",
-            f"<F_R_BTIMER_DOWN>0</F_R_BTIMER_DOWN>",
-            f"<F_R_WINE_COLOR>0</F_R_WINE_COLOR>",
-            f"<Image></Image>",
-            f"<F_R_IMAGE_X>0</F_R_IMAGE_X>",
-            f"<F_R_IMAGE_Y>0</F_R_IMAGE_Y>",
-        ]
-        
+        if today is None:
+            today = datetime.now().strftime('%Y-%m-%d')
+
+        # Each section is written as one block rather than collected line by line
+        out = io.StringIO()
+        write = out.write
+        esc = self._xml_escape
+
+        write(
+            f"<Recipe><_PERMID_>{recipe.id}</_PERMID_>\n"
+            f"<_MOD_>{today}</_MOD_>\n"
+            f"<F_R_NAME>{esc(recipe.name)}</F_R_NAME>\n"
+            f"<F_R_BREWER>{esc(recipe.brewer)}</F_R_BREWER>\n"
+            "<F_R_ASST_BREWER></F_R_ASST_BREWER>\n"
+            f"<F_R_DATE>{recipe.recipe_date or today}</F_R_DATE>\n"
+            f"<F_R_INV_DATE>{today}</F_R_INV_DATE>\n"
+            f"<F_R_FOLDER_NAME>{esc(recipe.folder)}</F_R_FOLDER_NAME>\n"
+            "<F_R_GRAIN_USE_SET>1</F_R_GRAIN_USE_SET>\n"
+            "<F_R_VOLUME_MEASURED>0.0000000</F_R_VOLUME_MEASURED>\n"
+            "<F_R_VOLUME_MEASURED_SET>0</F_R_VOLUME_MEASURED_SET>\n"
+            "<F_R_FINAL_VOL_MEASURED>0.0000000</F_R_FINAL_VOL_MEASURED>\n"
+            "<F_R_FINAL_VOL_MEASURED_SET>0</F_R_FINAL_VOL_MEASURED_SET>\n"
+            "<F_R_MASH_TIMER>0</F_R_MASH_TIMER>\n"
+            "<F_R_BOIL_TIMER>0</F_R_BOIL_TIMER>\n"
+            "<F_R_MTIMER_DOWN>0</F_R_MTIMER_DOWN>\n"
+            "<F_R_BTIMER_DOWN>0</F_R_BTIMER_DOWN>\n"
+            "<F_R_WINE_COLOR>0</F_R_WINE_COLOR>\n"
+            "<Image></Image>\n"
+            "<F_R_IMAGE_X>0</F_R_IMAGE_X>\n"
+            "<F_R_IMAGE_Y>0</F_R_IMAGE_Y>\n"
+        )
+
         # Add computed values that come after image
-        lines.extend([
-            f"<F_R_OG>{recipe.og:.7f}</F_R_OG>",
-            f"<F_R_FG>{recipe.fg:.7f}</F_R_FG>",
-            f"<F_R_IBU>{recipe.ibu:.7f}</F_R_IBU>",
-            f"<F_R_COLOR>{recipe.color_srm:.7f}</F_R_COLOR>",
-            f"<F_R_ABV>{recipe.abv:.7f}</F_R_ABV>",
-            f"<F_R_BOIL_TIME>{recipe.boil_time:.7f}</F_R_BOIL_TIME>",
-            f"<F_R_NOTES>{self._xml_escape(recipe.notes)}</F_R_NOTES>",
-        ])
+        write(
+            f"<F_R_OG>{recipe.og:.7f}</F_R_OG>\n"
+            f"<F_R_FG>{recipe.fg:.7f}</F_R_FG>\n"
+            f"<F_R_IBU>{recipe.ibu:.7f}</F_R_IBU>\n"
+            f"<F_R_COLOR>{recipe.color_srm:.7f}</F_R_COLOR>\n"
+            f"<F_R_ABV>{recipe.abv:.7f}</F_R_ABV>\n"
+            f"<F_R_BOIL_TIME>{recipe.boil_time:.7f}</F_R_BOIL_TIME>\n"
+            f"<F_R_NOTES>{esc(recipe.notes)}</F_R_NOTES>\n"
+        )
 
         # Add style if present
         if recipe.style:
-            lines.append("<F_R_STYLE>")
-            lines.append(f"<F_S_NAME>{self._xml_escape(recipe.style.name)}</F_S_NAME>")
-            lines.append(f"<F_S_CATEGORY>{self._xml_escape(recipe.style.category)}</F_S_CATEGORY>")
-            lines.append(f"<F_S_GUIDE>{self._xml_escape(recipe.style.guide)}</F_S_GUIDE>")
-            lines.append("</F_R_STYLE>")
+            style = recipe.style
+            write(
+                "<F_R_STYLE>\n"
+                f"<F_S_NAME>{esc(style.name)}</F_S_NAME>\n"
+                f"<F_S_CATEGORY>{esc(style.category)}</F_S_CATEGORY>\n"
+                f"<F_S_GUIDE>{esc(style.guide)}</F_S_GUIDE>\n"
+                "</F_R_STYLE>\n"
+            )
 
         # Add equipment profile if present
         if recipe.equipment:
-            lines.append("<F_R_EQUIPMENT>")
-            lines.append(f"<_PERMID_>0</_PERMID_>")
-            lines.append(f"<_MOD_>{datetime.now().strftime('%Y-%m-%d')}</_MOD_>")
-            lines.append(f"<F_E_NAME>{self._xml_escape(recipe.equipment.name)}</F_E_NAME>")
-            lines.append(f"<F_E_TYPE>{recipe.equipment.type}</F_E_TYPE>")
-            lines.append(f"<F_E_SHOW_BOIL>{1 if recipe.equipment.type in [0, 1] else 0}</F_E_SHOW_BOIL>")
-            lines.append(f"<F_E_MASH_VOL>{recipe.equipment.mash_vol_oz:.7f}</F_E_MASH_VOL>")
-            lines.append(f"<F_E_TUN_MASS>{recipe.equipment.tun_mass:.7f}</F_E_TUN_MASS>")
-            lines.append(f"<F_E_BOIL_RATE_FLAG>1</F_E_BOIL_RATE_FLAG>")
-            lines.append(f"<F_E_TUN_SPECIFIC_HEAT>{recipe.equipment.tun_specific_heat:.7f}</F_E_TUN_SPECIFIC_HEAT>")
-            lines.append(f"<F_E_TUN_DEADSPACE>{recipe.equipment.tun_deadspace:.7f}</F_E_TUN_DEADSPACE>")
-            lines.append(f"<F_E_TUN_ADDITION>0.0000000</F_E_TUN_ADDITION>")
-            lines.append(f"<F_E_TUN_ADJ_DEADSPACE>0</F_E_TUN_ADJ_DEADSPACE>")
-            lines.append(f"<F_E_CALC_BOIL>1</F_E_CALC_BOIL>")
-            lines.append(f"<F_E_BOIL_VOL>{recipe.equipment.boil_vol_oz:.7f}</F_E_BOIL_VOL>")
-            lines.append(f"<F_E_BOIL_TIME>{recipe.equipment.boil_time:.7f}</F_E_BOIL_TIME>")
-            lines.append(f"<F_E_OLD_EVAP_RATE>10.0000000</F_E_OLD_EVAP_RATE>")
-            lines.append(f"<F_E_BOIL_OFF>{recipe.equipment.boil_off_oz:.7f}</F_E_BOIL_OFF>")
-            lines.append(f"<F_E_TRUB_LOSS>{recipe.equipment.trub_loss_oz:.7f}</F_E_TRUB_LOSS>")
-            lines.append(f"<F_E_COOL_PCT>0.0000000</F_E_COOL_PCT>")
-            lines.append(f"<F_E_TOP_UP_KETTLE>0.0000000</F_E_TOP_UP_KETTLE>")
-            lines.append(f"<F_E_BATCH_VOL>{recipe.equipment.batch_vol_oz:.7f}</F_E_BATCH_VOL>")
-            lines.append(f"<F_E_FERMENTER_LOSS>{recipe.equipment.fermenter_loss_oz:.7f}</F_E_FERMENTER_LOSS>")
-            lines.append(f"<F_E_TOP_UP>0.0000000</F_E_TOP_UP>")
-            lines.append(f"<F_E_EFFICIENCY>{recipe.equipment.efficiency:.7f}</F_E_EFFICIENCY>")
-            lines.append(f"<F_E_HOP_UTIL>{recipe.equipment.hop_utilization:.7f}</F_E_HOP_UTIL>")
-            lines.append(f"<F_E_NOTES>{self._xml_escape(recipe.equipment.notes or '')}</F_E_NOTES>")
-            lines.append("</F_R_EQUIPMENT>")
+            equipment = recipe.equipment
+            write(
+                "<F_R_EQUIPMENT>\n"
+                "<_PERMID_>0</_PERMID_>\n"
+                f"<_MOD_>{today}</_MOD_>\n"
+                f"<F_E_NAME>{esc(equipment.name)}</F_E_NAME>\n"
+                f"<F_E_TYPE>{equipment.type}</F_E_TYPE>\n"
+                f"<F_E_SHOW_BOIL>{1 if equipment.type in [0, 1] else 0}</F_E_SHOW_BOIL>\n"
+                f"<F_E_MASH_VOL>{equipment.mash_vol_oz:.7f}</F_E_MASH_VOL>\n"
+                f"<F_E_TUN_MASS>{equipment.tun_mass:.7f}</F_E_TUN_MASS>\n"
+                "<F_E_BOIL_RATE_FLAG>1</F_E_BOIL_RATE_FLAG>\n"
+                f"<F_E_TUN_SPECIFIC_HEAT>{equipment.tun_specific_heat:.7f}</F_E_TUN_SPECIFIC_HEAT>\n"
+                f"<F_E_TUN_DEADSPACE>{equipment.tun_deadspace:.7f}</F_E_TUN_DEADSPACE>\n"
+                "<F_E_TUN_ADDITION>0.0000000</F_E_TUN_ADDITION>\n"
+                "<F_E_TUN_ADJ_DEADSPACE>0</F_E_TUN_ADJ_DEADSPACE>\n"
+                "<F_E_CALC_BOIL>1</F_E_CALC_BOIL>\n"
+                f"<F_E_BOIL_VOL>{equipment.boil_vol_oz:.7f}</F_E_BOIL_VOL>\n"
+                f"<F_E_BOIL_TIME>{equipment.boil_time:.7f}</F_E_BOIL_TIME>\n"
+                "<F_E_OLD_EVAP_RATE>10.0000000</F_E_OLD_EVAP_RATE>\n"
+                f"<F_E_BOIL_OFF>{equipment.boil_off_oz:.7f}</F_E_BOIL_OFF>\n"
+                f"<F_E_TRUB_LOSS>{equipment.trub_loss_oz:.7f}</F_E_TRUB_LOSS>\n"
+                "<F_E_COOL_PCT>0.0000000</F_E_COOL_PCT>\n"
+                "<F_E_TOP_UP_KETTLE>0.0000000</F_E_TOP_UP_KETTLE>\n"
+                f"<F_E_BATCH_VOL>{equipment.batch_vol_oz:.7f}</F_E_BATCH_VOL>\n"
+                f"<F_E_FERMENTER_LOSS>{equipment.fermenter_loss_oz:.7f}</F_E_FERMENTER_LOSS>\n"
+                "<F_E_TOP_UP>0.0000000</F_E_TOP_UP>\n"
+                f"<F_E_EFFICIENCY>{equipment.efficiency:.7f}</F_E_EFFICIENCY>\n"
+                f"<F_E_HOP_UTIL>{equipment.hop_utilization:.7f}</F_E_HOP_UTIL>\n"
+                f"<F_E_NOTES>{esc(equipment.notes or '')}</F_E_NOTES>\n"
+                "</F_R_EQUIPMENT>\n"
+            )
 
         # Add mash profile if present
         if recipe.mash:
-            lines.append("<F_R_MASH>")
-            lines.append(f"<_PERMID_>0</_PERMID_>")
-            lines.append(f"<_MOD_>{datetime.now().strftime('%Y-%m-%d')}</_MOD_>")
-            lines.append(f"<F_MH_NAME>{self._xml_escape(recipe.mash.name)}</F_MH_NAME>")
-            lines.append(f"<F_MH_GRAIN_WEIGHT>160.0000000</F_MH_GRAIN_WEIGHT>")
-            lines.append(f"<F_MH_GRAIN_TEMP>72.0000000</F_MH_GRAIN_TEMP>")
-            lines.append(f"<F_MH_BOIL_TEMP>212.0000000</F_MH_BOIL_TEMP>")
-            lines.append(f"<F_MH_TUN_TEMP>72.0000000</F_MH_TUN_TEMP>")
-            lines.append(f"<F_MH_PH>5.4000000</F_MH_PH>")
-            lines.append(f"<F_MH_SPARGE_TEMP>168.0000000</F_MH_SPARGE_TEMP>")
-            lines.append(f"<F_MH_NOTES>{self._xml_escape(recipe.mash.notes or '')}</F_MH_NOTES>")
-            
+            mash = recipe.mash
+            write(
+                "<F_R_MASH>\n"
+                "<_PERMID_>0</_PERMID_>\n"
+                f"<_MOD_>{today}</_MOD_>\n"
+                f"<F_MH_NAME>{esc(mash.name)}</F_MH_NAME>\n"
+                "<F_MH_GRAIN_WEIGHT>160.0000000</F_MH_GRAIN_WEIGHT>\n"
+                "<F_MH_GRAIN_TEMP>72.0000000</F_MH_GRAIN_TEMP>\n"
+                "<F_MH_BOIL_TEMP>212.0000000</F_MH_BOIL_TEMP>\n"
+                "<F_MH_TUN_TEMP>72.0000000</F_MH_TUN_TEMP>\n"
+                "<F_MH_PH>5.4000000</F_MH_PH>\n"
+                "<F_MH_SPARGE_TEMP>168.0000000</F_MH_SPARGE_TEMP>\n"
+                f"<F_MH_NOTES>{esc(mash.notes or '')}</F_MH_NOTES>\n"
+            )
+
             # Add mash steps if present
-            if recipe.mash.steps:
-                lines.append("<steps>")
-                lines.append("<Data>")
-                for step in recipe.mash.steps:
-                    lines.append("<MashStep>")
-                    lines.append(f"<F_MS_NAME>{self._xml_escape(step.name)}</F_MS_NAME>")
-                    lines.append(f"<F_MS_TYPE>{step.type}</F_MS_TYPE>")
-                    lines.append(f"<F_MS_INFUSION>{step.infusion_amount_oz:.7f}</F_MS_INFUSION>")
-                    lines.append(f"<F_MS_STEP_TEMP>{step.step_temp_f:.7f}</F_MS_STEP_TEMP>")
-                    lines.append(f"<F_MS_STEP_TIME>{step.step_time:.7f}</F_MS_STEP_TIME>")
-                    lines.append(f"<F_MS_RISE_TIME>{step.rise_time:.7f}</F_MS_RISE_TIME>")
-                    lines.append("</MashStep>")
-                lines.append("</Data>")
-                lines.append("</steps>")
-            
-            lines.append("</F_R_MASH>")
+            if mash.steps:
+                write("<steps>\n<Data>\n")
+                for step in mash.steps:
+                    write(
+                        "<MashStep>\n"
+                        f"<F_MS_NAME>{esc(step.name)}</F_MS_NAME>\n"
+                        f"<F_MS_TYPE>{step.type}</F_MS_TYPE>\n"
+                        f"<F_MS_INFUSION>{step.infusion_amount_oz:.7f}</F_MS_INFUSION>\n"
+                        f"<F_MS_STEP_TEMP>{step.step_temp_f:.7f}</F_MS_STEP_TEMP>\n"
+                        f"<F_MS_STEP_TIME>{step.step_time:.7f}</F_MS_STEP_TIME>\n"
+                        f"<F_MS_RISE_TIME>{step.rise_time:.7f}</F_MS_RISE_TIME>\n"
+                        "</MashStep>\n"
+                    )
+                write("</Data>\n</steps>\n")
+
+            write("</F_R_MASH>\n")
 
         # Add carbonation profile if present
         if recipe.carbonation:
-            lines.append("<F_R_CARB>")
-            lines.append(f"<_PERMID_>0</_PERMID_>")
-            lines.append(f"<_MOD_>{datetime.now().strftime('%Y-%m-%d')}</_MOD_>")
-            lines.append(f"<F_C_NAME>{self._xml_escape(recipe.carbonation.name)}</F_C_NAME>")
-            lines.append(f"<F_C_TEMPERATURE>{recipe.carbonation.temperature:.7f}</F_C_TEMPERATURE>")
-            lines.append(f"<F_C_TYPE>{recipe.carbonation.type}</F_C_TYPE>")
-            lines.append(f"<F_C_PRIMER_NAME>{self._xml_escape(recipe.carbonation.primer_name)}</F_C_PRIMER_NAME>")
-            lines.append(f"<F_C_CARB_RATE>{recipe.carbonation.carb_rate:.7f}</F_C_CARB_RATE>")
-            lines.append(f"<F_C_NOTES>{self._xml_escape(recipe.carbonation.notes)}</F_C_NOTES>")
-            lines.append("</F_R_CARB>")
+            carbonation = recipe.carbonation
+            write(
+                "<F_R_CARB>\n"
+                "<_PERMID_>0</_PERMID_>\n"
+                f"<_MOD_>{today}</_MOD_>\n"
+                f"<F_C_NAME>{esc(carbonation.name)}</F_C_NAME>\n"
+                f"<F_C_TEMPERATURE>{carbonation.temperature:.7f}</F_C_TEMPERATURE>\n"
+                f"<F_C_TYPE>{carbonation.type}</F_C_TYPE>\n"
+                f"<F_C_PRIMER_NAME>{esc(carbonation.primer_name)}</F_C_PRIMER_NAME>\n"
+                f"<F_C_CARB_RATE>{carbonation.carb_rate:.7f}</F_C_CARB_RATE>\n"
+                f"<F_C_NOTES>{esc(carbonation.notes)}</F_C_NOTES>\n"
+                "</F_R_CARB>\n"
+            )
 
         # Add age/fermentation profile if present
         if recipe.age:
-            lines.append("<F_R_AGE>")
-            lines.append(f"<_PERMID_>0</_PERMID_>")
-            lines.append(f"<_MOD_>{datetime.now().strftime('%Y-%m-%d')}</_MOD_>")
-            lines.append(f"<F_A_NAME>{self._xml_escape(recipe.age.name)}</F_A_NAME>")
-            lines.append(f"<F_A_PRIM_TEMP>{recipe.age.prim_temp:.7f}</F_A_PRIM_TEMP>")
-            lines.append(f"<F_A_PRIM_END_TEMP>{recipe.age.prim_end_temp:.7f}</F_A_PRIM_END_TEMP>")
-            lines.append(f"<F_A_SEC_TEMP>{recipe.age.sec_temp:.7f}</F_A_SEC_TEMP>")
-            lines.append(f"<F_A_SEC_END_TEMP>{recipe.age.sec_end_temp:.7f}</F_A_SEC_END_TEMP>")
-            lines.append(f"<F_A_TERT_TEMP>{recipe.age.tert_temp:.7f}</F_A_TERT_TEMP>")
-            lines.append(f"<F_A_AGE_TEMP>{recipe.age.age_temp:.7f}</F_A_AGE_TEMP>")
-            lines.append(f"<F_A_TERT_END_TEMP>{recipe.age.tert_end_temp:.7f}</F_A_TERT_END_TEMP>")
-            lines.append(f"<F_A_END_AGE_TEMP>{recipe.age.end_age_temp:.7f}</F_A_END_AGE_TEMP>")
-            lines.append(f"<F_A_BULK_TEMP>{recipe.age.bulk_temp:.7f}</F_A_BULK_TEMP>")
-            lines.append(f"<F_A_BULK_END_TEMP>{recipe.age.bulk_end_temp:.7f}</F_A_BULK_END_TEMP>")
-            lines.append(f"<F_A_PRIM_DAYS>{recipe.age.prim_days:.7f}</F_A_PRIM_DAYS>")
-            lines.append(f"<F_A_SEC_DAYS>{recipe.age.sec_days:.7f}</F_A_SEC_DAYS>")
-            lines.append(f"<F_A_TERT_DAYS>{recipe.age.tert_days:.7f}</F_A_TERT_DAYS>")
-            lines.append(f"<F_A_BULK_DAYS>{recipe.age.bulk_days:.7f}</F_A_BULK_DAYS>")
-            lines.append(f"<F_A_AGE>{recipe.age.age_days:.7f}</F_A_AGE>")
-            lines.append(f"<F_A_TYPE>{recipe.age.type}</F_A_TYPE>")
-            lines.append("</F_R_AGE>")
+            age = recipe.age
+            write(
+                "<F_R_AGE>\n"
+                "<_PERMID_>0</_PERMID_>\n"
+                f"<_MOD_>{today}</_MOD_>\n"
+                f"<F_A_NAME>{esc(age.name)}</F_A_NAME>\n"
+                f"<F_A_PRIM_TEMP>{age.prim_temp:.7f}</F_A_PRIM_TEMP>\n"
+                f"<F_A_PRIM_END_TEMP>{age.prim_end_temp:.7f}</F_A_PRIM_END_TEMP>\n"
+                f"<F_A_SEC_TEMP>{age.sec_temp:.7f}</F_A_SEC_TEMP>\n"
+                f"<F_A_SEC_END_TEMP>{age.sec_end_temp:.7f}</F_A_SEC_END_TEMP>\n"
+                f"<F_A_TERT_TEMP>{age.tert_temp:.7f}</F_A_TERT_TEMP>\n"
+                f"<F_A_AGE_TEMP>{age.age_temp:.7f}</F_A_AGE_TEMP>\n"
+                f"<F_A_TERT_END_TEMP>{age.tert_end_temp:.7f}</F_A_TERT_END_TEMP>\n"
+                f"<F_A_END_AGE_TEMP>{age.end_age_temp:.7f}</F_A_END_AGE_TEMP>\n"
+                f"<F_A_BULK_TEMP>{age.bulk_temp:.7f}</F_A_BULK_TEMP>\n"
+                f"<F_A_BULK_END_TEMP>{age.bulk_end_temp:.7f}</F_A_BULK_END_TEMP>\n"
+                f"<F_A_PRIM_DAYS>{age.prim_days:.7f}</F_A_PRIM_DAYS>\n"
+                f"<F_A_SEC_DAYS>{age.sec_days:.7f}</F_A_SEC_DAYS>\n"
+                f"<F_A_TERT_DAYS>{age.tert_days:.7f}</F_A_TERT_DAYS>\n"
+                f"<F_A_BULK_DAYS>{age.bulk_days:.7f}</F_A_BULK_DAYS>\n"
+                f"<F_A_AGE>{age.age_days:.7f}</F_A_AGE>\n"
+                f"<F_A_TYPE>{age.type}</F_A_TYPE>\n"
+                "</F_R_AGE>\n"
+            )
 
         # Add ingredients section
-        lines.append("<Ingredients>")
-        lines.append("<Data>")
+        write("<Ingredients>\n<Data>\n")
 
         # Add grains
         for grain in recipe.grains:
-            lines.append("<Grain>")
-            lines.append(f"<F_G_NAME>{self._xml_escape(grain.name)}</F_G_NAME>")
-            lines.append(f"<F_G_AMOUNT>{grain.amount_oz:.7f}</F_G_AMOUNT>")
-            lines.append(f"<F_G_COLOR>{grain.color:.7f}</F_G_COLOR>")
-            lines.append(f"<F_G_YIELD>{grain.yield_pct:.7f}</F_G_YIELD>")
-            lines.append(f"<F_G_TYPE>{grain.type}</F_G_TYPE>")
-            lines.append(f"<F_G_USE>{grain.use}</F_G_USE>")
-            lines.append("</Grain>")
+            write(
+                "<Grain>\n"
+                f"<F_G_NAME>{esc(grain.name)}</F_G_NAME>\n"
+                f"<F_G_AMOUNT>{grain.amount_oz:.7f}</F_G_AMOUNT>\n"
+                f"<F_G_COLOR>{grain.color:.7f}</F_G_COLOR>\n"
+                f"<F_G_YIELD>{grain.yield_pct:.7f}</F_G_YIELD>\n"
+                f"<F_G_TYPE>{grain.type}</F_G_TYPE>\n"
+                f"<F_G_USE>{grain.use}</F_G_USE>\n"
+                "</Grain>\n"
+            )
 
         # Add hops
         for hop in recipe.hops:
-            lines.append("<Hops>")
-            lines.append(f"<F_H_NAME>{self._xml_escape(hop.name)}</F_H_NAME>")
-            lines.append(f"<F_H_AMOUNT>{hop.amount_oz:.7f}</F_H_AMOUNT>")
-            lines.append(f"<F_H_ALPHA>{hop.alpha:.7f}</F_H_ALPHA>")
-            lines.append(f"<F_H_BOIL_TIME>{hop.boil_time:.7f}</F_H_BOIL_TIME>")
-            lines.append(f"<F_H_USE>{hop.use}</F_H_USE>")
-            lines.append(f"<F_H_TYPE>{hop.type}</F_H_TYPE>")
-            lines.append("</Hops>")
+            write(
+                "<Hops>\n"
+                f"<F_H_NAME>{esc(hop.name)}</F_H_NAME>\n"
+                f"<F_H_AMOUNT>{hop.amount_oz:.7f}</F_H_AMOUNT>\n"
+                f"<F_H_ALPHA>{hop.alpha:.7f}</F_H_ALPHA>\n"
+                f"<F_H_BOIL_TIME>{hop.boil_time:.7f}</F_H_BOIL_TIME>\n"
+                f"<F_H_USE>{hop.use}</F_H_USE>\n"
+                f"<F_H_TYPE>{hop.type}</F_H_TYPE>\n"
+                "</Hops>\n"
+            )
 
         # Add yeasts
         for yeast in recipe.yeasts:
-            lines.append("<Yeast>")
-            lines.append(f"<F_Y_NAME>{self._xml_escape(yeast.name)}</F_Y_NAME>")
-            lines.append(f"<F_Y_LAB>{self._xml_escape(yeast.lab)}</F_Y_LAB>")
-            lines.append(f"<F_Y_PRODUCT_ID>{self._xml_escape(yeast.product_id)}</F_Y_PRODUCT_ID>")
-            lines.append(f"<F_Y_AMOUNT>{yeast.amount:.7f}</F_Y_AMOUNT>")
-            lines.append(f"<F_Y_TYPE>{yeast.type}</F_Y_TYPE>")
-            lines.append(f"<F_Y_FORM>{yeast.form}</F_Y_FORM>")
-            lines.append("</Yeast>")
+            write(
+                "<Yeast>\n"
+                f"<F_Y_NAME>{esc(yeast.name)}</F_Y_NAME>\n"
+                f"<F_Y_LAB>{esc(yeast.lab)}</F_Y_LAB>\n"
+                f"<F_Y_PRODUCT_ID>{esc(yeast.product_id)}</F_Y_PRODUCT_ID>\n"
+                f"<F_Y_AMOUNT>{yeast.amount:.7f}</F_Y_AMOUNT>\n"
+                f"<F_Y_TYPE>{yeast.type}</F_Y_TYPE>\n"
+                f"<F_Y_FORM>{yeast.form}</F_Y_FORM>\n"
+                "</Yeast>\n"
+            )
 
-        lines.append("</Data>")
-        lines.append("</Ingredients>")
-        lines.append("</Recipe>")
+        write("</Data>\n</Ingredients>\n</Recipe>")
 
-        return "\n".join(lines)
+        return out.getvalue()
 
     def save_recipe(self, recipe: Recipe) -> bool:
         """
@@ -969,14 +1374,15 @@ class BeerSmithParser:
         export_dir = self.beersmith_path / "MCP_Exports"
         export_dir.mkdir(exist_ok=True)
         
-        filename = re.sub(r'[^\w\-_]', '_', recipe.name) + ".bsmx"
+        filename = _UNSAFE_FILENAME_RE.sub('_', recipe.name) + ".bsmx"
         filepath = export_dir / filename
         
-        xml_content = self._generate_recipe_xml(recipe)
+        today = datetime.now().strftime('%Y-%m-%d')
+        xml_content = self._generate_recipe_xml(recipe, today)
         
         # Wrap in proper container structure
         full_xml = f"""<Recipe><_PERMID_>0</_PERMID_>
-<_MOD_>{datetime.now().strftime('%Y-%m-%d')}</_MOD_>
+<_MOD_>{today}</_MOD_>
 <Name>MCP Export</Name>
 <Type>7372</Type>
 <Dirty>1</Dirty>
@@ -998,42 +1404,59 @@ class BeerSmithParser:
         This makes the recipe appear in BeerSmith without manual import.
         Creates a backup before modifying the file.
         """
+        return self.add_recipes_to_beersmith([recipe])
+
+    def add_recipes_to_beersmith(self, recipes: list[Recipe]) -> bool:
+        """
+        Add several recipes to BeerSmith's Recipe.bsmx file in a single rewrite.
+
+        The file is backed up, searched and rewritten once for the whole batch rather
+        than once per recipe.
+        """
         recipe_file = self.beersmith_path / "Recipe.bsmx"
         
         if not recipe_file.exists():
             raise FileNotFoundError(f"Recipe.bsmx not found at {recipe_file}")
+        if not recipes:
+            return True
         
-        # Create backup
-        self.backup_path.mkdir(exist_ok=True)
-        backup_file = self.backup_path / f"Recipe_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.bsmx"
-        shutil.copy2(recipe_file, backup_file)
-        
-        # Read the current Recipe.bsmx file
-        content = recipe_file.read_text(encoding="utf-8")
+        # Read the current Recipe.bsmx file as bytes - only the new XML needs encoding
+        content = recipe_file.read_bytes()
         
-        # Generate the recipe XML
-        recipe_xml = self._generate_recipe_xml(recipe)
+        # Generate the recipe XML, one after the other
+        today = datetime.now().strftime('%Y-%m-%d')
+        recipe_xml = "".join(self._generate_recipe_xml(recipe, today) for recipe in recipes)
         
         # Create a Table (folder) structure for "MCP Created" if it doesn't exist
         # We'll wrap the recipe in a proper folder structure
         folder_name = "MCP Created"
+        # The name as it appears in Recipe.bsmx, so it can be searched for and written
+        folder_name_xml = _escape_xml_text(folder_name)
         
-        import re
+        # Check if the "MCP Created" folder already exists, i.e. a <Table> followed by its
+        # <Name>, then <Data>...</Data> and a closing </Table>
+        folder_data_end = -1
+        table_start = content.find(b"<Table>")
+        if table_start != -1:
+            name_tag = f"<Name>{folder_name_xml}</Name>".encode()
+            name_pos = content.find(name_tag, table_start + len(b"<Table>"))
+            if name_pos != -1:
+                data_pos = content.find(b"<Data>", name_pos)
+                if data_pos != -1:
+                    data_end = content.find(b"</Data>", data_pos + len(b"<Data>"))
+                    if data_end != -1 and content.find(b"</Table>", data_end) != -1:
+                        folder_data_end = data_end
         
-        # Check if the "MCP Created" folder already exists
-        mcp_folder_pattern = r'<Table>.*?<Name>MCP Created</Name>.*?<Data>(.*?)</Data>.*?</Table>'
-        folder_match = re.search(mcp_folder_pattern, content, re.DOTALL)
-        
-        if folder_match:
+        if folder_data_end != -1:
             # Folder exists - insert the recipe into it
-            # Find the position right before the closing </Data> of the MCP Created folder
-            folder_data_end = folder_match.end(1)  # End of the Data content
-            new_content = content[:folder_data_end] + recipe_xml + content[folder_data_end:]
+            # Insert right before the closing </Data> of the MCP Created folder
+            insert_pos = folder_data_end
+            insert_xml = recipe_xml
         else:
             # Folder doesn't exist - create it with the recipe inside
             folder_xml = f"""<Table><_PERMID_>9999</_PERMID_>
-<_MOD_>{datetime.now().strftime('%Y-%m-%d')}</_MOD_>
-<Name>{folder_name}</Name>
+<_MOD_>{today}</_MOD_>
+<Name>{folder_name_xml}</Name>
 <Type>7372</Type>
 <Dirty>1</Dirty>
 <Owndata>1</Owndata>
@@ -1055,20 +1478,43 @@ class BeerSmithParser:
             # Insert the folder at the end of the main Data section
             # Find the correct position: before the LAST </Data> that's followed by <_TExpanded> and has <PermCount> nearby
             # This pattern uniquely identifies the main data section closing
-            end_pattern = r'</Data>\s*\n\s*<_TExpanded>[^<]*</[^>]+>[^<]*<TExtra>[^<]*</[^>]+>[^<]*<TxLog>1</TxLog>'
-            match = re.search(end_pattern, content)
-            if match:
-                # Insert right before the </Data> tag
-                insert_pos = match.start()
-                new_content = content[:insert_pos] + folder_xml + content[insert_pos:]
-            else:
+            # Rather than scanning the whole file with the pattern, find each <TxLog>1</TxLog>
+            # and check the pattern from the </Data> that would have to precede it
+            insert_pos = -1
+            token_pos = content.find(_MAIN_DATA_END_TOKEN)
+            while token_pos != -1:
+                expanded_pos = content.rfind(b"<_TExpanded>", 0, token_pos)
+                data_end = content.rfind(b"</Data>", 0, expanded_pos) if expanded_pos != -1 else -1
+                if data_end != -1 and _MAIN_DATA_END_RE.match(content, data_end):
+                    insert_pos = data_end
+                    break
+                token_pos = content.find(_MAIN_DATA_END_TOKEN, token_pos + 1)
+            if insert_pos == -1:
                 raise ValueError("Could not find insertion point in Recipe.bsmx")
+            # Insert right before the </Data> tag
+            insert_xml = folder_xml
         
-        # Write the modified content
-        recipe_file.write_text(new_content, encoding="utf-8")
+        # Create backup. _replace_file swaps in a new file instead of rewriting this one,
+        # so a hard link keeps the old content without copying it
+        self.backup_path.mkdir(exist_ok=True)
+        backup_file = self.backup_path / f"Recipe_backup_{time.strftime('%Y%m%d_%H%M%S')}.bsmx"
+        # Link the real file, which is the one _replace_file swaps out
+        linked = self._link_or_copy(Path(os.path.realpath(recipe_file)), backup_file)
+
+        # Write the modified content, copying the untouched parts straight from the old bytes
+        view = memoryview(content)
+        try:
+            self._replace_file(
+                recipe_file, (view[:insert_pos], insert_xml.encode("utf-8"), view[insert_pos:])
+            )
+        except BaseException:
+            # The link would still be the live file, changing along with it
+            if linked:
+                backup_file.unlink(missing_ok=True)
+            raise
         
-        # Clear cache
-        self._cache.clear()
+        # Clear cache - only Recipe.bsmx changed, so the ingredient and Cloud.bsmx caches stay
+        self._recipes_cache = None
         
         return True
 
@@ -1101,22 +1547,14 @@ class BeerSmithParser:
         if not file_path.exists():
             raise FileNotFoundError(f"{filename} not found at {file_path}")
         
-        # Create backup
-        self.backup_path.mkdir(exist_ok=True)
-        backup_file = self.backup_path / f"{filename.replace('.bsmx', '')}_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.bsmx"
-        shutil.copy2(file_path, backup_file)
-        
-        # Read the file
-        content = file_path.read_text(encoding="utf-8")
+        # Read the file as bytes - only the edited record is decoded and re-encoded
+        content = file_path.read_bytes()
         
-        # Parse XML to find the ingredient
-        from lxml import etree
-        parser = etree.XMLParser(recover=True, encoding='utf-8')
+        # Parse XML to find the ingredient, with this thread's shared parser
+        parser = _xml_parser()
         
         # Split by root elements (multi-root XML)
-        import re
-        pattern = f'<{tag_name}>.*?</{tag_name}>'
-        matches = list(re.finditer(pattern, content, re.DOTALL))
+        matches = list(_INGREDIENT_CHUNK_RES[tag_name].finditer(content))
         
         if not matches:
             raise ValueError(f"No {tag_name} elements found in {filename}")
@@ -1124,21 +1562,52 @@ class BeerSmithParser:
         # Find the ingredient by name
         ingredient_found = False
         updated_content = content
+        keys = _model_keys(model_class)
+        name_key = model_class.model_fields["name"].alias
+        ingredient_name_lower = ingredient_name.lower()
+        name_tag = f"<{name_key.upper()}>".encode("ascii")
+        name_needle = ingredient_name_lower.encode("utf-8")
         
         for match in matches:
             xml_chunk = match.group(0)
+
+            # Skip records whose plain ASCII name can't match without parsing them;
+            # names with entities, markup or repeated name tags still get the full parse
+            name_start = xml_chunk.find(name_tag)
+            if name_start != -1:
+                name_start += len(name_tag)
+                name_end = xml_chunk.find(b"<", name_start)
+                raw_name = xml_chunk[name_start:name_end]
+                if (
+                    raw_name.lower() != name_needle
+                    and raw_name.isascii()
+                    and b"&" not in raw_name
+                    and xml_chunk.startswith(b"</", name_end)
+                    and xml_chunk.find(name_tag, name_end) == -1
+                ):
+                    continue
+
             try:
-                root = etree.fromstring(xml_chunk.encode('utf-8'), parser=parser)
-                item_dict = self._element_to_dict(root)
+                root = etree.fromstring(xml_chunk, parser=parser)
+                item_dict = self._element_to_dict(root, keys)
+
+                # Compare the raw name first; only the candidate needs full validation
+                name = item_dict.get(name_key, item_dict.get("name"))
+                if not isinstance(name, str) or name.lower() != ingredient_name_lower:
+                    continue
                 item = model_class.model_validate(item_dict)
                 
                 # Check if this is the ingredient we're looking for
-                if item.name.lower() == ingredient_name.lower():
+                if item.name.lower() == ingredient_name_lower:
                     ingredient_found = True
                     
                     # Apply updates to the XML
-                    updated_xml = self._update_xml_fields(xml_chunk, updates, model_class)
-                    updated_content = updated_content.replace(xml_chunk, updated_xml)
+                    updated_xml = self._update_xml_fields(
+                        xml_chunk.decode("utf-8"), updates, model_class
+                    )
+                    updated_content = updated_content.replace(
+                        xml_chunk, updated_xml.encode("utf-8")
+                    )
                     break
                     
             except Exception:
@@ -1147,12 +1616,24 @@ class BeerSmithParser:
         if not ingredient_found:
             raise ValueError(f"Ingredient '{ingredient_name}' not found in {filename}")
         
+        # Create backup now that there is a change to make. The file is replaced rather
+        # than rewritten below, so a hard link keeps the old content without copying it
+        self.backup_path.mkdir(exist_ok=True)
+        backup_file = self.backup_path / f"{filename.replace('.bsmx', '')}_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.bsmx"
+        # Link the real file, which is the one _replace_file swaps out
+        linked = self._link_or_copy(Path(os.path.realpath(file_path)), backup_file)
+        
         # Write the updated content
-        file_path.write_text(updated_content, encoding="utf-8")
+        try:
+            self._replace_file(file_path, (updated_content,))
+        except BaseException:
+            # The link would still be the live file, changing along with it
+            if linked:
+                backup_file.unlink(missing_ok=True)
+            raise
         
         # Clear cache
-        if filename in self._cache:
-            del self._cache[filename]
+        self._items_cache.pop(filename, None)
         
         return True
     
@@ -1182,88 +1663,134 @@ class BeerSmithParser:
                 new_value = f"{new_value:.7f}"
             
             # Replace the field value in XML
-            import re
-            pattern = f'<{xml_tag}>.*?</{xml_tag}>'
             replacement = f'<{xml_tag}>{new_value}</{xml_tag}>'
-            updated_xml = re.sub(pattern, replacement, updated_xml, count=1)
+            updated_xml = _xml_field_re(xml_tag).sub(replacement, updated_xml, count=1)
         
         return updated_xml
 
+    # === Async Write Methods ===
+
+    async def _run_write(self, method: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a blocking write method in a worker thread so the event loop stays free.
+
+        Writes are read-modify-write cycles on the BeerSmith files, so they still run
+        one at a time.
+        """
+        def run() -> Any:
+            with self._write_lock:
+                return method(*args)
+
+        return await asyncio.to_thread(run)
+
+    async def save_recipe_async(self, recipe: Recipe) -> bool:
+        """Async version of save_recipe."""
+        return await self._run_write(self.save_recipe, recipe)
+
+    async def add_recipe_to_beersmith_async(self, recipe: Recipe) -> bool:
+        """Async version of add_recipe_to_beersmith."""
+        return await self._run_write(self.add_recipe_to_beersmith, recipe)
+
+    async def add_recipes_to_beersmith_async(self, recipes: list[Recipe]) -> bool:
+        """Async version of add_recipes_to_beersmith."""
+        return await self._run_write(self.add_recipes_to_beersmith, recipes)
+
+    async def update_ingredient_async(
+        self, ingredient_type: str, ingredient_name: str, updates: dict
+    ) -> bool:
+        """Async version of update_ingredient."""
+        return await self._run_write(
+            self.update_ingredient, ingredient_type, ingredient_name, updates
+        )
+
     def export_recipe_beerxml(self, recipe: Recipe) -> str:
         """Export a recipe in BeerXML format."""
-        # BeerXML 1.0 format
-        lines = [
-            '<?xml version="1.0" encoding="UTF-8"?>',
-            '<RECIPES>',
-            '  <RECIPE>',
-            f'    <NAME>{self._xml_escape(recipe.name)}</NAME>',
-            '    <VERSION>1</VERSION>',
-            '    <TYPE>All Grain</TYPE>',
-            f'    <BREWER>{self._xml_escape(recipe.brewer)}</BREWER>',
-            f'    <BATCH_SIZE>{recipe.batch_size_liters:.2f}</BATCH_SIZE>',
-            f'    <BOIL_SIZE>{recipe.batch_size_liters * 1.2:.2f}</BOIL_SIZE>',
-            f'    <BOIL_TIME>{recipe.boil_time:.0f}</BOIL_TIME>',
-            f'    <EFFICIENCY>{recipe.efficiency:.1f}</EFFICIENCY>',
-        ]
+        # BeerXML 1.0 format, written a block at a time like _generate_recipe_xml
+        out = io.StringIO()
+        write = out.write
+        esc = self._xml_escape
+        batch_size_liters = recipe.batch_size_liters
+
+        write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<RECIPES>\n'
+            '  <RECIPE>\n'
+            f'    <NAME>{esc(recipe.name)}</NAME>\n'
+            '    <VERSION>1</VERSION>\n'
+            '    <TYPE>All Grain</TYPE>\n'
+            f'    <BREWER>{esc(recipe.brewer)}</BREWER>\n'
+            f'    <BATCH_SIZE>{batch_size_liters:.2f}</BATCH_SIZE>\n'
+            f'    <BOIL_SIZE>{batch_size_liters * 1.2:.2f}</BOIL_SIZE>\n'
+            f'    <BOIL_TIME>{recipe.boil_time:.0f}</BOIL_TIME>\n'
+            f'    <EFFICIENCY>{recipe.efficiency:.1f}</EFFICIENCY>\n'
+        )
 
         # Add hops
-        lines.append('    <HOPS>')
+        write('    <HOPS>\n')
         for hop in recipe.hops:
-            lines.append('      <HOP>')
-            lines.append(f'        <NAME>{self._xml_escape(hop.name)}</NAME>')
-            lines.append('        <VERSION>1</VERSION>')
-            lines.append(f'        <ALPHA>{hop.alpha:.2f}</ALPHA>')
-            lines.append(f'        <AMOUNT>{hop.amount_grams / 1000:.4f}</AMOUNT>')
-            lines.append(f'        <USE>{hop.use_name}</USE>')
-            lines.append(f'        <TIME>{hop.boil_time:.0f}</TIME>')
-            lines.append('      </HOP>')
-        lines.append('    </HOPS>')
+            write(
+                '      <HOP>\n'
+                f'        <NAME>{esc(hop.name)}</NAME>\n'
+                '        <VERSION>1</VERSION>\n'
+                f'        <ALPHA>{hop.alpha:.2f}</ALPHA>\n'
+                f'        <AMOUNT>{hop.amount_grams / 1000:.4f}</AMOUNT>\n'
+                f'        <USE>{hop.use_name}</USE>\n'
+                f'        <TIME>{hop.boil_time:.0f}</TIME>\n'
+                '      </HOP>\n'
+            )
+        write('    </HOPS>\n')
 
         # Add fermentables
-        lines.append('    <FERMENTABLES>')
+        write('    <FERMENTABLES>\n')
         for grain in recipe.grains:
-            lines.append('      <FERMENTABLE>')
-            lines.append(f'        <NAME>{self._xml_escape(grain.name)}</NAME>')
-            lines.append('        <VERSION>1</VERSION>')
-            lines.append(f'        <TYPE>{grain.type_name}</TYPE>')
-            lines.append(f'        <AMOUNT>{grain.amount_kg:.4f}</AMOUNT>')
-            lines.append(f'        <YIELD>{grain.yield_pct:.1f}</YIELD>')
-            lines.append(f'        <COLOR>{grain.color:.1f}</COLOR>')
-            lines.append('      </FERMENTABLE>')
-        lines.append('    </FERMENTABLES>')
+            write(
+                '      <FERMENTABLE>\n'
+                f'        <NAME>{esc(grain.name)}</NAME>\n'
+                '        <VERSION>1</VERSION>\n'
+                f'        <TYPE>{grain.type_name}</TYPE>\n'
+                f'        <AMOUNT>{grain.amount_kg:.4f}</AMOUNT>\n'
+                f'        <YIELD>{grain.yield_pct:.1f}</YIELD>\n'
+                f'        <COLOR>{grain.color:.1f}</COLOR>\n'
+                '      </FERMENTABLE>\n'
+            )
+        write('    </FERMENTABLES>\n')
 
         # Add yeasts
-        lines.append('    <YEASTS>')
+        write('    <YEASTS>\n')
         for yeast in recipe.yeasts:
-            lines.append('      <YEAST>')
-            lines.append(f'        <NAME>{self._xml_escape(yeast.name)}</NAME>')
-            lines.append('        <VERSION>1</VERSION>')
-            lines.append(f'        <TYPE>{yeast.type_name}</TYPE>')
-            lines.append(f'        <FORM>{yeast.form_name}</FORM>')
-            lines.append(f'        <LABORATORY>{self._xml_escape(yeast.lab)}</LABORATORY>')
-            lines.append(f'        <PRODUCT_ID>{self._xml_escape(yeast.product_id)}</PRODUCT_ID>')
-            lines.append(f'        <MIN_TEMPERATURE>{yeast.min_temp_c:.1f}</MIN_TEMPERATURE>')
-            lines.append(f'        <MAX_TEMPERATURE>{yeast.max_temp_c:.1f}</MAX_TEMPERATURE>')
-            lines.append(f'        <ATTENUATION>{yeast.avg_attenuation:.1f}</ATTENUATION>')
-            lines.append('      </YEAST>')
-        lines.append('    </YEASTS>')
+            write(
+                '      <YEAST>\n'
+                f'        <NAME>{esc(yeast.name)}</NAME>\n'
+                '        <VERSION>1</VERSION>\n'
+                f'        <TYPE>{yeast.type_name}</TYPE>\n'
+                f'        <FORM>{yeast.form_name}</FORM>\n'
+                f'        <LABORATORY>{esc(yeast.lab)}</LABORATORY>\n'
+                f'        <PRODUCT_ID>{esc(yeast.product_id)}</PRODUCT_ID>\n'
+                f'        <MIN_TEMPERATURE>{yeast.min_temp_c:.1f}</MIN_TEMPERATURE>\n'
+                f'        <MAX_TEMPERATURE>{yeast.max_temp_c:.1f}</MAX_TEMPERATURE>\n'
+                f'        <ATTENUATION>{yeast.avg_attenuation:.1f}</ATTENUATION>\n'
+                '      </YEAST>\n'
+            )
+        write('    </YEASTS>\n')
 
         # Add style if present
         if recipe.style:
-            lines.append('    <STYLE>')
-            lines.append(f'      <NAME>{self._xml_escape(recipe.style.name)}</NAME>')
-            lines.append('      <VERSION>1</VERSION>')
-            lines.append(f'      <CATEGORY>{self._xml_escape(recipe.style.category)}</CATEGORY>')
-            lines.append(f'      <STYLE_GUIDE>{self._xml_escape(recipe.style.guide)}</STYLE_GUIDE>')
-            lines.append(f'      <OG_MIN>{recipe.style.min_og:.3f}</OG_MIN>')
-            lines.append(f'      <OG_MAX>{recipe.style.max_og:.3f}</OG_MAX>')
-            lines.append(f'      <FG_MIN>{recipe.style.min_fg:.3f}</FG_MIN>')
-            lines.append(f'      <FG_MAX>{recipe.style.max_fg:.3f}</FG_MAX>')
-            lines.append(f'      <IBU_MIN>{recipe.style.min_ibu:.1f}</IBU_MIN>')
-            lines.append(f'      <IBU_MAX>{recipe.style.max_ibu:.1f}</IBU_MAX>')
-            lines.append('    </STYLE>')
-
-        lines.append('  </RECIPE>')
-        lines.append('</RECIPES>')
-
-        return '\n'.join(lines)
+            style = recipe.style
+            write(
+                '    <STYLE>\n'
+                f'      <NAME>{esc(style.name)}</NAME>\n'
+                '      <VERSION>1</VERSION>\n'
+                f'      <CATEGORY>{esc(style.category)}</CATEGORY>\n'
+                f'      <STYLE_GUIDE>{esc(style.guide)}</STYLE_GUIDE>\n'
+                f'      <OG_MIN>{style.min_og:.3f}</OG_MIN>\n'
+                f'      <OG_MAX>{style.max_og:.3f}</OG_MAX>\n'
+                f'      <FG_MIN>{style.min_fg:.3f}</FG_MIN>\n'
+                f'      <FG_MAX>{style.max_fg:.3f}</FG_MAX>\n'
+                f'      <IBU_MIN>{style.min_ibu:.1f}</IBU_MIN>\n'
+                f'      <IBU_MAX>{style.max_ibu:.1f}</IBU_MAX>\n'
+                '    </STYLE>\n'
+            )
+
+        write('  </RECIPE>\n</RECIPES>')
+
+        return out.getvalue()
@@ -2,6 +2,7 @@
 
 import json
 import os
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -434,7 +435,7 @@ def get_recipe(recipe_name: str) -> str:
 
 
 @mcp.tool()
-def create_recipe(
+async def create_recipe(
     name: str,
     style_name: str,
     equipment_name: str,
@@ -606,10 +607,10 @@ def create_recipe(
     # Save recipe
     try:
         # Add recipe directly to BeerSmith's Recipe.bsmx
-        parser.add_recipe_to_beersmith(recipe)
+        await parser.add_recipe_to_beersmith_async(recipe)
         
         # Also save as exportable file for backup
-        parser.save_recipe(recipe)
+        await parser.save_recipe_async(recipe)
         export_path = parser.beersmith_path / "MCP_Exports"
         
         return (
@@ -900,7 +901,7 @@ def get_yeast(yeast_name: str) -> str:
 
 
 @mcp.tool()
-def update_ingredient(
+async def update_ingredient(
     ingredient_type: str,
     ingredient_name: str,
     updates_json: str
@@ -949,7 +950,7 @@ def update_ingredient(
             return "Error: updates_json must be a JSON object (dictionary)"
         
         # Perform the update
-        success = parser.update_ingredient(ingredient_type, ingredient_name, updates)
+        success = await parser.update_ingredient_async(ingredient_type, ingredient_name, updates)
         
         if success:
             updated_fields = ", ".join(updates.keys())
@@ -1549,7 +1550,7 @@ def suggest_recipes(available_ingredients_json: str) -> str:
 
 
 @mcp.tool()
-def sync_prices_from_grocy(
+async def sync_prices_from_grocy(
     grocy_products_json: str,
     threshold: float = 0.7,
     dry_run: bool = True,
@@ -1661,10 +1662,8 @@ def sync_prices_from_grocy(
         # Update BeerSmith if not a dry run
         if not dry_run:
             try:
-                success = parser.update_ingredient(
-                    ingredient_type=best_match.matched_type,
-                    ingredient_name=best_match.matched_name,
-                    updates={"price": product_price},
+                success = await parser.update_ingredient_async(
+                    best_match.matched_type, best_match.matched_name, {"price": product_price}
                 )
                 if success:
                     updated.append(best_match.matched_name)
@@ -1821,6 +1820,8 @@ def oz_to_liters(oz: float) -> float:
 
 def main():
     """Run the BeerSmith MCP server."""
+    # Load the BeerSmith files in the background so the first tool call doesn't wait on them
+    threading.Thread(target=parser.warm_cache, daemon=True).start()
     mcp.run()
 
 
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""Shared helpers for the debug scripts."""
+
+import os
+from functools import lru_cache
+
+from lxml import etree
+
+from beersmith_mcp.parser import BeerSmithParser
+
+EQUIPMENT_PATH = str(BeerSmithParser().beersmith_path / 'Equipment.bsmx')
+
+
+@lru_cache(maxsize=4)
+def _parse_root(path: str, mtime: float) -> etree._Element:
+    # collect_ids=False skips building the ID table, which nothing here uses
+    parser = etree.XMLParser(recover=True, encoding='utf-8', huge_tree=True, collect_ids=False)
+    return etree.parse(path, parser).getroot()
+
+
+def load_equipment_root(path: str = EQUIPMENT_PATH) -> etree._Element:
+    """Parse Equipment.bsmx directly with lxml, reusing the tree until the file changes."""
+    return _parse_root(path, os.path.getmtime(path))
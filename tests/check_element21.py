@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 from beersmith_mcp.parser import BeerSmithParser
 
+# Go through the parser so the tree has its entity and encoding fixes applied
 parser = BeerSmithParser()
-parser._cache.clear()
 root = parser._parse_xml_file('Equipment.bsmx')
 
 all_equipment = list(root.iter('Equipment'))
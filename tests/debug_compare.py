@@ -1,18 +1,14 @@
 #!/usr/bin/env python3
 """Compare parser XML vs direct lxml."""
 
-from lxml import etree
+from _shared_debug import load_equipment_root
 from beersmith_mcp.parser import BeerSmithParser
 
 # Direct lxml
-path = '/Users/john/Library/Application Support/BeerSmith3/Equipment.bsmx'
-parser_xml = etree.XMLParser(recover=True, encoding='utf-8')
-tree = etree.parse(path, parser_xml)
-root_direct = tree.getroot()
+root_direct = load_equipment_root()
 
 # Via parser
 parser = BeerSmithParser()
-parser._cache.clear()
 root_parser = parser._parse_xml_file('Equipment.bsmx')
 
 print("Direct lxml:")
@@ -1,12 +1,9 @@
 #!/usr/bin/env python3
 """Debug equipment parsing."""
 
-from lxml import etree
+from _shared_debug import load_equipment_root
 
-path = '/Users/john/Library/Application Support/BeerSmith3/Equipment.bsmx'
-parser_xml = etree.XMLParser(recover=True, encoding='utf-8')
-tree = etree.parse(path, parser_xml)
-root = tree.getroot()
+root = load_equipment_root()
 
 print("Root tag:", root.tag)
 print("Root element count:", len(list(root.iter())))
@@ -5,19 +5,15 @@ from beersmith_mcp.parser import BeerSmithParser
 from beersmith_mcp.models import Equipment
 
 parser = BeerSmithParser()
-root = parser._parse_xml_file('Equipment.bsmx')
 
-print(f"Root: {root}")
-print(f"Root tag: {root.tag}")
-
-# Test the iter logic
-for item_elem in root.iter("Equipment"):
-    if item_elem is root:
+# Stream the Equipment elements instead of building the whole tree
+for item_elem in parser.iter_elements('Equipment.bsmx', 'Equipment'):
+    parent = item_elem.getparent()
+    if parent is None:
         print("Skipping root (item_elem is root)")
         continue
     
-    parent = item_elem.getparent()
-    if parent is not None and parent.tag == "Data":
+    if parent.tag == "Data":
         continue
     
     item_dict = parser._element_to_dict(item_elem)
@@ -27,8 +23,7 @@ for item_elem in root.iter("Equipment"):
         continue
         
     print(f"\nFound equipment outside Data: {name}")
-    print(f"  Parent: {parent.tag if parent else 'None'}")
-    print(f"  Parent is root: {parent is root}")
+    print(f"  Parent: {parent.tag}")
     
     try:
         item = Equipment.model_validate(item_dict)
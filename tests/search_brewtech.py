@@ -1,10 +1,8 @@
 #!/usr/bin/env python3
-from lxml import etree
+from _shared_debug import EQUIPMENT_PATH as path
+from _shared_debug import load_equipment_root
 
-path = '/Users/john/Library/Application Support/BeerSmith3/Equipment.bsmx'
-parser = etree.XMLParser(recover=True, encoding='utf-8')
-tree = etree.parse(path, parser)
-root = tree.getroot()
+root = load_equipment_root(path)
 
 print("Searching for Brewtech equipment...")
 found = False